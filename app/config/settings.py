@@ -5,13 +5,13 @@ import MetaTrader5 as mt5
 class Config:
     # === Symbols ===
     MAX_SYMBOLS = 10
-    SYMBOLS = ["EURUSD"]
+    SYMBOLS: tuple[str, ...] = ("EURUSD",)
 
     # === Timeframes (system + MTF signal gating) ===
-    TIMEFRAME = mt5.TIMEFRAME_M1
-    TF_ENTRY = mt5.TIMEFRAME_M1
-    TF_CONFIRM = mt5.TIMEFRAME_M5
-    TF_BIAS = mt5.TIMEFRAME_M15
+    TIMEFRAME: int = mt5.TIMEFRAME_M1
+    TF_ENTRY: int = mt5.TIMEFRAME_M1
+    TF_CONFIRM: int = mt5.TIMEFRAME_M5
+    TF_BIAS: int = mt5.TIMEFRAME_M15
 
     # === Daily limits ===
     DAILY_TARGET_PROFIT = 200
@@ -34,7 +34,7 @@ class Config:
     LOG_LEVEL = "INFO"
 
     # === Data / indicators ===
-    CANDLE_COUNT = 2000
+    CANDLE_COUNT: int = 2000
     MIN_CANDLES_FOR_INDICATORS = 202
     CONFIDENCE_THRESHOLD = 0.5
 
@@ -50,11 +50,8 @@ class Config:
     # --- Spread gate ---
     MAX_SPREAD_POINTS: float = 0
 
-    # --- Multi-timeframe strategy ---
+    # --- Multi-timeframe strategy (timeframes: see TF_ENTRY/TF_CONFIRM/TF_BIAS) ---
     USE_MULTI_TIMEFRAME_SIGNALS = False
-    TF_ENTRY = mt5.TIMEFRAME_M1
-    TF_CONFIRM = mt5.TIMEFRAME_M5
-    TF_BIAS = mt5.TIMEFRAME_M15
 
     # --- N-tick confirmation strategy ---
     USE_N_TICK_CONFIRMATION = True
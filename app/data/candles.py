@@ -1,11 +1,67 @@
 import datetime
+import logging
 import threading
+from collections import deque
+from dataclasses import dataclass
 import time
 import MetaTrader5 as mt5
 from typing import Any, Optional
 from app.config.settings import Config
 from app.data.market_data import MarketData
 
+logger = logging.getLogger(__name__)
+
+# Bar length in seconds per MT5 timeframe constant
+_TF_SECONDS: dict[int, int] = {
+    mt5.TIMEFRAME_M1: 60,
+    mt5.TIMEFRAME_M5: 5 * 60,
+    mt5.TIMEFRAME_M15: 15 * 60,
+    mt5.TIMEFRAME_M30: 30 * 60,
+    mt5.TIMEFRAME_H1: 60 * 60,
+}
+
+# How long a learned server-vs-local clock offset is trusted (seconds)
+_SERVER_OFFSET_TTL = 3600.0
+
+# Bars requested per refresh once a full window is held. More than one, so the
+# oldest returned bar overlaps the window and proves no bar was skipped.
+_DELTA_BARS = 3
+
+
+class _ServerClock:
+    """
+    Server-minus-local clock offset for one symbol, re-learned from a tick at
+    most once every _SERVER_OFFSET_TTL seconds. MT5 bar and tick times are
+    server epochs, so bar deadlines are compared against wall time + offset.
+    """
+
+    __slots__ = ("symbol", "offset", "_learned_at")
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.offset = 0
+        self._learned_at: Optional[float] = None
+
+    def refresh(self, wall_epoch: int) -> int:
+        now = time.monotonic()
+        if self._learned_at is not None and now - self._learned_at < _SERVER_OFFSET_TTL:
+            return self.offset
+        tick = mt5.symbol_info_tick(self.symbol)
+        tick_epoch = int(getattr(tick, "time", 0) or 0)
+        if tick_epoch:
+            self.offset = tick_epoch - wall_epoch
+            self._learned_at = now
+        return self.offset
+
+
+def _bar_epoch(t: Any) -> Optional[int]:
+    """Server epoch of a MarketData bar time (naive datetimes come from fromtimestamp)."""
+    if isinstance(t, datetime.datetime):
+        return int(t.timestamp())
+    if isinstance(t, (int, float)):
+        return int(t)
+    return None
+
 
 def create_live_candle_collector(
     symbol: str = "EURUSD",
@@ -31,48 +87,46 @@ class LiveCandleCollector:
         self.timeframe = timeframe or Config.TIMEFRAME
         self.count = count or Config.MIN_CANDLES_FOR_INDICATORS
         self.interval = interval or 60
+        self._tf_seconds = int(_TF_SECONDS.get(self.timeframe, self.interval or 60))
 
         self.market_data = MarketData()
-        self.latest_candles = []
+        # Immutable snapshot, replaced wholesale by the collector thread.
+        # Rebinding one attribute is atomic, so readers need no lock.
+        self._latest_snapshot: tuple[dict, ...] = ()
+        # Rolling window owned by the collector thread; oldest bar drops off on append
+        self._buf: deque[dict] = deque(maxlen=self.count)
 
         self._running = False
         self._thread = None
-        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._clock = _ServerClock(symbol)
 
     def start(self) -> None:
         """Idempotent start."""
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._collect, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop background collection thread."""
         self._running = False
+        self._stop_event.set()  # wake the collector out of its wait
         t = self._thread
         self._thread = None
         if t:
             t.join(timeout=5)
 
-    def get_latest_candles(self):
-        """Return a snapshot of the latest candles (thread-safe)."""
-        with self._lock:
-            return list(self.latest_candles)
-
-    def _timeframe_seconds(self) -> int:
-        tf = self.timeframe
-        mapping = {
-            mt5.TIMEFRAME_M1: 60,
-            mt5.TIMEFRAME_M5: 5 * 60,
-            mt5.TIMEFRAME_M15: 15 * 60,
-            mt5.TIMEFRAME_M30: 30 * 60,
-            mt5.TIMEFRAME_H1: 60 * 60,
-        }
-        return int(mapping.get(tf, self.interval or 60))
+    def get_latest_candles(self) -> tuple[dict, ...]:
+        """
+        Return the published candle snapshot (lock-free, no copy).
+        The tuple is shared and immutable; callers that need a list must copy it.
+        """
+        return self._latest_snapshot
 
     def _collect(self):
-        tf_seconds = self._timeframe_seconds()
         last_candle_time = None
 
         # Initial pull: get full window
@@ -84,42 +138,68 @@ class LiveCandleCollector:
                 count=self.count,
                 verbose=False,
             )
-            with self._lock:
-                self.latest_candles = candles
+            self._buf.clear()
+            self._buf.extend(candles)
+            self._latest_snapshot = tuple(self._buf)
             if candles:
                 last_candle_time = candles[-1]["time"]
-                print(
-                    f"[{self.symbol}] Initial candle window: {last_candle_time} (count={len(candles)})"
+                logger.info(
+                    "[%s] Initial candle window: %s (count=%d)",
+                    self.symbol,
+                    last_candle_time,
+                    len(candles),
                 )
-        except Exception as e:
-            print(f"[LiveCandleCollector] Error fetching initial candles: {e}")
+        except Exception:
+            logger.exception("[LiveCandleCollector] Error fetching initial candles")
 
-        while self._running:
+        while not self._stop_event.is_set():
+            wait_s = 1
             try:
                 # Fetch only the latest closed candle
                 new_candle_list = self.market_data.get_symbol_data(
                     self.symbol, self.timeframe, num_bars=1, closed_only=True
                 )
                 if not new_candle_list:
-                    time.sleep(1)
+                    if self._stop_event.wait(1):
+                        return
                     continue
                 new_candle = new_candle_list[0]
                 new_candle_time = new_candle["time"]
 
                 # Only append if it's a new candle
                 if last_candle_time is None or new_candle_time > last_candle_time:
-                    with self._lock:
-                        self.latest_candles.append(new_candle)
-                        if len(self.latest_candles) > self.count:
-                            self.latest_candles.pop(0)
+                    # Roll the window in place, then publish an immutable copy
+                    self._buf.append(new_candle)
+                    snapshot = tuple(self._buf)
+                    self._latest_snapshot = snapshot
                     last_candle_time = new_candle_time
-                    print(
-                        f"[{self.symbol}] New candle: {new_candle_time} (count={len(self.latest_candles)})"
+                    logger.info(
+                        "[%s] New candle: %s (count=%d)",
+                        self.symbol,
+                        new_candle_time,
+                        len(snapshot),
                     )
-            except Exception as e:
-                print(f"[LiveCandleCollector] Error fetching candles: {e}")
+                    wait_s = self._seconds_to_next_close(new_candle_time)
+            except Exception:
+                logger.exception("[LiveCandleCollector] Error fetching candles")
+
+            # Sleep to the bar boundary after a new candle, else re-poll every second
+            # until the broker publishes it; returns early on stop()
+            if self._stop_event.wait(max(1, wait_s)):
+                return
 
-            time.sleep(1)  # Poll every second for new candle
+    def _seconds_to_next_close(self, bar_time: Any) -> int:
+        """
+        Seconds until the bar after `bar_time` closes (+1s slack). The deadline
+        is the bar's server epoch + 2 * tf, compared against the server clock,
+        so a skewed local clock cannot shift it.
+        """
+        wall_epoch = int(time.time())
+        server_now = wall_epoch + self._clock.refresh(wall_epoch)
+        bar_epoch = _bar_epoch(bar_time)
+        if bar_epoch is None:
+            return self._tf_seconds - (server_now % self._tf_seconds) + 1
+        return bar_epoch + 2 * self._tf_seconds + 1 - server_now
 
 
 def create_multi_timeframe_candle_collector(
@@ -162,6 +242,7 @@ class MultiTimeframeCandleCollector:
         self._running = False
         self._thread = None
         self._lock = threading.Lock()
+        self._stop_event = threading.Event()
 
         self._latest_by_tf: dict[int, list[dict]] = {tf: [] for tf in self.timeframes}
         self._last_bar_time_by_tf: dict[int, Any] = {tf: None for tf in self.timeframes}
@@ -169,15 +250,20 @@ class MultiTimeframeCandleCollector:
         # schedule: next epoch second when we should refresh each tf
         self._next_due_by_tf: dict[int, int] = {tf: 0 for tf in self.timeframes}
 
+        # server-minus-local clock offset, refreshed from a tick once an hour
+        self._clock = _ServerClock(symbol)
+
     def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._collect, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         t = self._thread
         self._thread = None
         if t:
@@ -194,14 +280,7 @@ class MultiTimeframeCandleCollector:
             return list(self._latest_by_tf.get(timeframe, []))
 
     def _timeframe_seconds(self, tf: int) -> int:
-        mapping = {
-            mt5.TIMEFRAME_M1: 60,
-            mt5.TIMEFRAME_M5: 5 * 60,
-            mt5.TIMEFRAME_M15: 15 * 60,
-            mt5.TIMEFRAME_M30: 30 * 60,
-            mt5.TIMEFRAME_H1: 60 * 60,
-        }
-        return int(mapping.get(tf, 60))
+        return _TF_SECONDS.get(tf, 60)
 
     def _align_next_due(self, now_epoch: int, tf: int) -> int:
         tf_seconds = self._timeframe_seconds(tf)
@@ -238,44 +317,73 @@ class MultiTimeframeCandleCollector:
             return None
         return None
 
+    def _sync_tf_candles(self, tf: int) -> list[dict]:
+        """
+        Closed candles for `tf`. Once a full window is held only the last few
+        bars are fetched and the new ones appended; a first run, a short
+        window or a gap wider than the delta falls back to a full refetch.
+        """
+        held = self._latest_by_tf.get(tf) or []
+        if len(held) >= self.count:
+            fresh = self.market_data.get_historical_candles(
+                self.symbol,
+                timeframe=tf,
+                start_pos=1,
+                count=_DELTA_BARS,
+                verbose=False,
+            )
+            last_time = held[-1]["time"]
+            if fresh and fresh[0]["time"] <= last_time:
+                new = [c for c in fresh if c["time"] > last_time]
+                if not new:
+                    return held
+                for c in new:
+                    c["symbol"] = self.symbol
+                return (held + new)[-self.count :]
+
+        candles = self.market_data.get_historical_candles(
+            self.symbol,
+            timeframe=tf,
+            start_pos=1,
+            count=self.count,
+            verbose=False,
+        )
+        for c in candles:
+            c["symbol"] = self.symbol
+        return candles
+
     def _stamp_is_closed(self, candles: list[dict], tf: int, now_epoch: int) -> None:
         tf_seconds = self._timeframe_seconds(tf)
-        for c in candles or []:
-            if not isinstance(c, dict):
-                continue
-            te = self._candle_time_to_epoch(c.get("time"))
+        # Candles are time-ordered: walk back from the newest, and once one is
+        # closed every older one is too, so stop converting times there
+        for i in range(len(candles) - 1, -1, -1):
+            c = candles[i]
+            te = self._candle_time_to_epoch(c["time"])
             if te is None:
                 # if unknown, don't block trading (match your strategy’s default)
                 c.setdefault("is_closed", True)
                 continue
-            c["is_closed"] = bool((te + tf_seconds) <= now_epoch)
+            if te + tf_seconds <= now_epoch:
+                for older in candles[: i + 1]:
+                    older["is_closed"] = True
+                return
+            c["is_closed"] = False
 
     def _collect(self):
         for tf in self.timeframes:
             self._next_due_by_tf[tf] = 0
 
-        while self._running:
+        while not self._stop_event.is_set():
             wall_epoch = int(time.time())
-            tick = mt5.symbol_info_tick(self.symbol)
-            tick_epoch = int(getattr(tick, "time", 0) or 0)
-
             now_epoch = wall_epoch
-            stamp_epoch = tick_epoch or wall_epoch
+            stamp_epoch = wall_epoch + self._clock.refresh(wall_epoch)
 
             for tf in self.timeframes:
                 if now_epoch < int(self._next_due_by_tf.get(tf, 0) or 0):
                     continue
 
                 try:
-                    candles = self.market_data.get_historical_candles(
-                        self.symbol,
-                        timeframe=tf,
-                        start_pos=1,
-                        count=self.count,
-                        verbose=False,
-                    )
-                    for c in candles:
-                        c["symbol"] = self.symbol
+                    candles = self._sync_tf_candles(tf)
                     if candles:
                         self._stamp_is_closed(candles, tf, stamp_epoch)
 
@@ -301,20 +409,32 @@ class MultiTimeframeCandleCollector:
                             and new_ep is not None
                             and (new_ep - last_ep) > tf_s
                         ):
-                            print(
-                                f"[{self.symbol}] TF={tf} candle jump: last={last_time} new={newest_time} "
-                                f"(delta={new_ep - last_ep}s, tick_epoch={tick_epoch}, wall_epoch={wall_epoch})"
+                            logger.warning(
+                                "[%s] TF=%s candle jump: last=%s new=%s "
+                                "(delta=%ss, stamp_epoch=%s, wall_epoch=%s)",
+                                self.symbol,
+                                tf,
+                                last_time,
+                                newest_time,
+                                new_ep - last_ep,
+                                stamp_epoch,
+                                wall_epoch,
                             )
 
                         if last_time is None or newest_time != last_time:
-                            print(
-                                f"[{self.symbol}] New candle tf={tf}: {newest_time} (count={len(candles)})"
+                            logger.info(
+                                "[%s] New candle tf=%s: %s (count=%d)",
+                                self.symbol,
+                                tf,
+                                newest_time,
+                                len(candles),
                             )
                             self._last_bar_time_by_tf[tf] = newest_time
 
-                except Exception as e:
-                    print(
-                        f"[MultiTimeframeCandleCollector] Error fetching candles tf={tf}: {e}"
+                except Exception:
+                    logger.exception(
+                        "[MultiTimeframeCandleCollector] Error fetching candles tf=%s",
+                        tf,
                     )
 
                 self._next_due_by_tf[tf] = self._align_next_due(now_epoch, tf)
@@ -324,39 +444,48 @@ class MultiTimeframeCandleCollector:
                 if self._next_due_by_tf
                 else (now_epoch + 1)
             )
-            time.sleep(max(1, int(next_due - now_epoch)))
+            if self._stop_event.wait(max(1, int(next_due - now_epoch))):
+                return
+
+
+@dataclass(frozen=True, slots=True)
+class TFConfig:
+    """Entry/confirm/bias timeframes plus the candle window size per timeframe."""
+
+    entry: int
+    confirm: int
+    bias: int
+    count: int
+
+    @classmethod
+    def from_config(cls, config: Any = Config) -> "TFConfig":
+        return cls(
+            entry=int(getattr(config, "TF_ENTRY", mt5.TIMEFRAME_M1)),
+            confirm=int(getattr(config, "TF_CONFIRM", mt5.TIMEFRAME_M5)),
+            bias=int(getattr(config, "TF_BIAS", mt5.TIMEFRAME_M15)),
+            count=int(getattr(config, "MIN_CANDLES_FOR_INDICATORS", 202)) + 1,
+        )
 
 
 def create_candle_collector(
     symbol: str = "EURUSD",
-    tf_entry=None,
-    tf_confirm=None,
-    tf_bias=None,
-    count=None,
+    tf: Optional[TFConfig] = None,
     config: Any = Config,
 ):
     """
     Factory: returns either single-timeframe or multi-timeframe candle collector based on config.
     """
+    tf = tf or TFConfig.from_config(config)
     use_multi = getattr(config, "USE_MULTI_TIMEFRAME_SIGNALS", False)
     if use_multi:
-        # Use all provided timeframes, or config defaults
-        timeframes = [tf for tf in [tf_entry, tf_confirm, tf_bias] if tf is not None]
-        if not timeframes:
-            timeframes = [
-                getattr(config, "TF_ENTRY", mt5.TIMEFRAME_M1),
-                getattr(config, "TF_CONFIRM", mt5.TIMEFRAME_M5),
-                getattr(config, "TF_BIAS", mt5.TIMEFRAME_M15),
-            ]
         return create_multi_timeframe_candle_collector(
             symbol=symbol,
-            timeframes=timeframes,
-            count=count,
+            timeframes=[tf.entry, tf.confirm, tf.bias],
+            count=tf.count,
         )
     else:
-        tf = tf_entry or getattr(config, "TF_ENTRY", mt5.TIMEFRAME_M1)
         return create_live_candle_collector(
             symbol=symbol,
-            timeframe=tf,
-            count=count,
+            timeframe=tf.entry,
+            count=tf.count,
         )
@@ -1,23 +1,44 @@
+import logging
 import threading
-import time
 import MetaTrader5 as mt5
 
+logger = logging.getLogger(__name__)
 
-def create_tick_collector(symbol="EURUSD", interval=1, on_tick=None):
+# How long stop_collecting waits for the collector loop to return
+_STOP_TIMEOUT_SECONDS = 5.0
+
+
+def create_tick_collector(symbol="EURUSD", interval=1, on_tick=None, executor=None):
     """
     Provider for DI wiring of TickCollector.
     Returns a TickCollector instance (does not start it).
     """
-    return TickCollector(symbol=symbol, interval=interval, on_tick=on_tick)
+    return TickCollector(
+        symbol=symbol, interval=interval, on_tick=on_tick, executor=executor
+    )
 
 
 class TickCollector:
-    def __init__(self, symbol="EURUSD", interval=0.1, on_tick=None):
+    __slots__ = (
+        "symbol",
+        "interval",
+        "on_tick",
+        "executor",
+        "_running",
+        "_thread",
+        "_future",
+        "_stop_event",
+    )
+
+    def __init__(self, symbol="EURUSD", interval=0.1, on_tick=None, executor=None):
         self.symbol = symbol
         self.interval = interval  # seconds
         self.on_tick = on_tick  # callback: function(tick)
+        self.executor = executor  # optional shared pool (concurrent.futures)
         self._running = False
         self._thread = None
+        self._future = None
+        self._stop_event = threading.Event()
 
     def set_callback(self, cb):
         """Set the callback to be called on every tick."""
@@ -32,6 +53,10 @@ class TickCollector:
     def start_collecting(self):
         if not self._running:
             self._running = True
+            self._stop_event.clear()
+            if self.executor is not None:
+                self._future = self.executor.submit(self._collect)
+                return
             self._thread = threading.Thread(target=self._collect, daemon=True)
             self._thread.start()
 
@@ -40,18 +65,30 @@ class TickCollector:
 
     def stop_collecting(self):
         self._running = False
-        if self._thread:
-            self._thread.join()
+        self._stop_event.set()  # wake the collector out of its wait
+        future, self._future = self._future, None
+        # A task still queued behind busy pool workers is just dropped
+        if future is not None and not future.cancel():
+            try:
+                future.result(timeout=_STOP_TIMEOUT_SECONDS)
+            except Exception:
+                logger.exception("[TickCollector] collector did not stop cleanly")
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(_STOP_TIMEOUT_SECONDS)
 
     def _collect(self):
-        last_tick_time = None
-        while self._running:
+        last_tick_msc = None
+        while not self._stop_event.is_set():
             try:
                 tick = mt5.symbol_info_tick(self.symbol)
                 if tick and self.on_tick:
-                    if tick.time != last_tick_time:
+                    # time_msc distinguishes several ticks within one second
+                    tick_msc = getattr(tick, "time_msc", None) or tick.time
+                    if tick_msc != last_tick_msc:
                         self.on_tick(tick)
-                        last_tick_time = tick.time
-            except Exception as e:
-                print(f"[TickCollector] Error fetching tick: {e}")
-            time.sleep(self.interval)
+                        last_tick_msc = tick_msc
+            except Exception:
+                logger.exception("[TickCollector] Error fetching tick")
+            if self._stop_event.wait(self.interval):
+                return
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitAction:
     ticket: Any
     symbol: str
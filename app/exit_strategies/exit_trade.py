@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -19,6 +20,9 @@ from app.exit_strategies.exit_shared import (
 from app.exit_strategies.managers.profit import ProfitExitManager
 from app.exit_strategies.managers.loss import LossExitManager
 
+# Exit cooldown entries kept; older tickets are long closed
+_MAX_EXIT_TIMES_TRACKED = 4096
+
 
 def create_exit_trade(
     broker: Any, risk_manager: Any, config: Optional["ExitTradeConfig"] = None
@@ -120,7 +124,8 @@ class ExitTrade:
         self._config = config or ExitTradeConfig()
         self._state_by_ticket: dict[Any, PosState] = {}
         self._bias_by_symbol: dict[str, dict[str, Any]] = {}
-        self._last_exit_time: dict[Any, float] = {}
+        # ticket -> last exit time, oldest first; bounded, see _should_exit
+        self._last_exit_time: OrderedDict[Any, float] = OrderedDict()
         self._exit_cooldown: float = float(
             getattr(Config, "EXIT_COOLDOWN_SECONDS", 2.0) or 2.0
         )
@@ -244,9 +249,10 @@ class ExitTrade:
             close_px = float(close_price)
         except Exception:
             return []
-        positions = self._safe_get_positions()
+        # Broker filters by symbol (server-side for MT5) instead of scanning
+        # every open position here; state pruning is left to on_tick
+        positions = self._safe_get_positions(symbol)
         if not positions:
-            self._state_by_ticket.clear()
             return []
         actions: list[ExitAction] = []
         for pos in positions:
@@ -269,11 +275,14 @@ class ExitTrade:
     # --- Helper methods (unchanged, copy from your original ExitTrade) ---
     def _should_exit(self, ticket: Any, cooldown: Optional[float] = None) -> bool:
         cooldown = cooldown if cooldown is not None else self._exit_cooldown
-        now = time.time()
-        last = self._last_exit_time.get(ticket, 0)
-        if now - last < cooldown:
+        now = time.monotonic()
+        last = self._last_exit_time.get(ticket)
+        if last is not None and now - last < cooldown:
             return False
         self._last_exit_time[ticket] = now
+        self._last_exit_time.move_to_end(ticket)
+        while len(self._last_exit_time) > _MAX_EXIT_TIMES_TRACKED:
+            self._last_exit_time.popitem(last=False)
         return True
 
     def _dynamic_buffer(self, symbol: str, fallback_pips: float) -> float:
@@ -328,11 +337,11 @@ class ExitTrade:
         except Exception:
             pass
 
-    def _safe_get_positions(self):
+    def _safe_get_positions(self, symbol: Optional[str] = None):
         getter = getattr(self._broker, "get_open_positions", None)
         try:
             if callable(getter):
-                return getter()
+                return getter(symbol) if symbol else getter()
         except Exception as exc:
             print(f"[ExitTrade] ERROR: get_open_positions failed: {exc}")
         return []
@@ -1,39 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from app.config.settings import Config
 from app.data.market_data import create_market_data
 from app.trade_execution.mode import TradingMode as Mode
 from app.risk.risk_manager import create_risk_manager
 from app.trade_execution.broker import create_broker
 from app.trade_execution.trade_execution import create_trade_executor
-from app.data.candles import create_candle_collector
+from app.data.candles import TFConfig, create_candle_collector
 from app.services.trade_services import create_orchestrator
 from app.data.tick_collector import create_tick_collector
 from app.trade_execution.helpers.prepare_trade import create_enter_trade
 from app.exit_strategies.exit_trade import create_exit_trade
 from app.signals.signal_generation import strategy_factory
-import MetaTrader5 as mt5
 
 md = create_market_data()
 br = create_broker(Mode.LIVE)
 rm = create_risk_manager(br)
 
-tf_entry = int(getattr(Config, "TF_ENTRY", mt5.TIMEFRAME_M1))
-tf_confirm = int(getattr(Config, "TF_CONFIRM", mt5.TIMEFRAME_M5))
-tf_bias = int(getattr(Config, "TF_BIAS", mt5.TIMEFRAME_M15))
+tf_config = TFConfig.from_config(Config)
 
 trade_executor = create_trade_executor(rm, br, md)
 enter_trade = create_enter_trade(md, rm, br, trade_executor)  # <-- Wire TradeExecutor
 
+symbols = Config.SYMBOLS
+
+# One pool for every long-running loop (candle loop + tick loop per symbol),
+# so worker threads are reused across start/stop instead of respawned.
+# Twice the loop count leaves headroom for a restart whose new loops are
+# submitted while the old ones are still winding down.
+SHARED_POOL = ThreadPoolExecutor(
+    max_workers=max(2, 4 * len(symbols)), thread_name_prefix="signals"
+)
+
 orchestrators = {}
-for symbol in getattr(Config, "SYMBOLS", ["EURUSD"]):
-    collector = create_candle_collector(
-        symbol=symbol,
-        tf_entry=tf_entry,
-        tf_confirm=tf_confirm,
-        tf_bias=tf_bias,
-        count=int(Config.MIN_CANDLES_FOR_INDICATORS) + 1,
-        config=Config,
-    )
-    tick = create_tick_collector(symbol=symbol, interval=0.1)
+default_orchestrator = None
+for symbol in symbols:
+    collector = create_candle_collector(symbol=symbol, tf=tf_config, config=Config)
+    tick = create_tick_collector(symbol=symbol, interval=0.1, executor=SHARED_POOL)
     exit_trade = create_exit_trade(broker=br, risk_manager=rm)
     signal_generator = strategy_factory(config=Config)
     orchestrator = create_orchestrator(
@@ -44,10 +47,13 @@ for symbol in getattr(Config, "SYMBOLS", ["EURUSD"]):
         exit_trade=exit_trade,
         broker=br,
         enter_trade=enter_trade,
+        executor=SHARED_POOL,
     )
     orchestrators[symbol] = orchestrator
+    if default_orchestrator is None:
+        default_orchestrator = orchestrator
 
 # For backward compatibility, export the first orchestrator as signal_orchestrator
-signal_orchestrator = next(iter(orchestrators.values()))
+signal_orchestrator = default_orchestrator
 
 # Export orchestrators dict, trade_executor, br, rm, md for endpoints
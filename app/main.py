@@ -2,14 +2,23 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 import MetaTrader5 as mt5
 from app.routes.endpoints import router
+from app.factory import orchestrators, SHARED_POOL
+from app.utils.configure_logging import start_queue_logging, stop_queue_logging
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if not mt5.initialize():
         raise RuntimeError("MT5 initialization failed")
+    # Trading threads only enqueue log records; a listener thread writes them
+    log_listener = start_queue_logging()
     yield
+    # Pool workers are non-daemon: stop the loops so shutdown doesn't hang
+    for orch in orchestrators.values():
+        orch.stop()
+    SHARED_POOL.shutdown(wait=False, cancel_futures=True)
     mt5.shutdown()
+    stop_queue_logging(log_listener)
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,4 +1,6 @@
-import MetaTrader5 as mt5
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def create_risk_manager(broker):
@@ -14,41 +16,44 @@ class RiskManager:
     def reset_daily_risk(self):
         self.daily_risk_used = 0.0
 
-    def calculate_lot_size(
-        self, account_balance, sl_pips, symbol_price, symbol, risk_percent
-    ):
+    def calculate_lot_size(self, account_balance, sl_pips, symbol, risk_percent):
         MIN_SL_PIPS = 5
 
         # Ensure SL is in pips
         if sl_pips < MIN_SL_PIPS:
-            print(
-                f"SL pips too small for {symbol}, adjusting to minimum {MIN_SL_PIPS}."
+            logger.debug(
+                "SL pips too small for %s, adjusting to minimum %s.",
+                symbol,
+                MIN_SL_PIPS,
             )
             sl_pips = MIN_SL_PIPS
 
-        pip = self.broker.get_pip_size(
-            symbol
-        )  # <-- true pip size (price units per pip)
-        contract_size = self.broker.get_lot_value(symbol)
+        pip = float(self.broker.get_pip_size(symbol))  # price units per pip
+        contract_size = float(self.broker.get_lot_value(symbol))
         risk_amount = account_balance * (risk_percent / 100.0)
 
         # SL distance in price units
-        sl_distance = float(sl_pips) * float(pip)
+        sl_distance = float(sl_pips) * pip
 
         lot = risk_amount / (sl_distance * contract_size) if sl_distance > 0 else 0.0
 
-        info = mt5.symbol_info(symbol)
+        info = self.broker.get_symbol_info(symbol)
         if info is None:
-            print(f"Failed to get symbol info for {symbol}")
+            logger.warning("Failed to get symbol info for %s", symbol)
             return 0.0
 
         # Clamp lot size to broker limits
         lot = max(min(lot, info.volume_max), info.volume_min)
         lot = round(lot / info.volume_step) * info.volume_step
-        lot = float(f"{lot:.2f}")
-
-        print(
-            f"Calculated lot size for {symbol}: {lot} "
-            f"(risk_amount={risk_amount}, sl_pips={sl_pips}, pip={pip}, contract_size={contract_size})"
+        lot = round(lot, 2)
+
+        logger.debug(
+            "Calculated lot size for %s: %s (risk_amount=%s, sl_pips=%s, pip=%s, contract_size=%s)",
+            symbol,
+            lot,
+            risk_amount,
+            sl_pips,
+            pip,
+            contract_size,
         )
         return lot
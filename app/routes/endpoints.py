@@ -1,3 +1,6 @@
+import asyncio
+import logging
+
 from fastapi import APIRouter
 
 from app.factory import (
@@ -11,6 +14,8 @@ from app.factory import (
 from app.utils.backtest_signals import backtest_signals
 from app.config.settings import Config
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -18,6 +23,24 @@ def get_any_orchestrator():
     return signal_orchestrator
 
 
+async def fetch_many(symbols, timeframe, count, start_pos=0):
+    """
+    Fetch historical candles for several symbols concurrently.
+    Each MT5 call runs in the default thread pool, so N symbols cost ~1 round-trip
+    instead of N sequential ones. Returns dict[symbol] -> candles.
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *[
+            loop.run_in_executor(
+                None, md.get_historical_candles, s, timeframe, start_pos, count
+            )
+            for s in symbols
+        ]
+    )
+    return dict(zip(symbols, results))
+
+
 @router.get("/status")
 def get_status():
     running = {sym: orch.is_running() for sym, orch in orchestrators.items()}
@@ -25,7 +48,7 @@ def get_status():
         "orchestrator_running": running,
         "daily_profit": getattr(trade_executor, "daily_profit", None),
         "last_reset": getattr(trade_executor, "last_reset", None),
-        "active_symbols": list(getattr(Config, "SYMBOLS", ["EURUSD"])),
+        "active_symbols": list(Config.SYMBOLS),
     }
 
 
@@ -67,7 +90,9 @@ def get_tick(symbol: str = None):
 @router.get("/simulated_positions")
 def get_simulated_positions():
     if getattr(br, "mode", None) == br.mode.DEMO:
-        print(f"Paper trading mode: {len(br.open_positions_sim)} open positions")
+        logger.debug(
+            "Paper trading mode: %s open positions", len(br.open_positions_sim)
+        )
     return br.open_positions_sim
 
 
@@ -80,10 +105,18 @@ def close_all_trades():
 @router.get("/test_historical")
 def test_historical():
     candles = md.get_historical_candles(
-        "EURUSD",
+        Config.SYMBOLS[0],
         timeframe=Config.TIMEFRAME,
         start_pos=0,
-        count=getattr(Config, "CANDLE_COUNT", 500),
+        count=Config.CANDLE_COUNT,
+    )
+    return {"candles": candles}
+
+
+@router.get("/historical")
+async def historical_all_symbols():
+    candles = await fetch_many(
+        Config.SYMBOLS, timeframe=Config.TIMEFRAME, count=Config.CANDLE_COUNT
     )
     return {"candles": candles}
 
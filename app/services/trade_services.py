@@ -1,14 +1,78 @@
 from __future__ import annotations
 
+import inspect
+import logging
 import threading
 import time
+from concurrent.futures import Executor, Future
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-import MetaTrader5 as mt5
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.config.settings import Config
 
+_logger = logging.getLogger(__name__)
+
+# Candle flags that mark a bar as closed, in precedence order
+_CLOSED_KEY_ORDER = ("is_closed", "closed", "complete", "is_complete")
+_CLOSED_KEYS = frozenset(_CLOSED_KEY_ORDER)
+_MISSING = object()
+
+# Candle loop pacing: with a tick feed the loop sleeps until a tick crosses a
+# minute boundary, then polls fast for a few seconds while the collector
+# publishes the new bar
+_IDLE_WAIT_SECONDS = 1.0
+_CATCH_UP_SECONDS = 5.0
+# How long stop() waits for the candle loop to finish its iteration
+_STOP_TIMEOUT_SECONDS = 5.0
+
+# How the signal generator is called, picked once from its signature
+# (same precedence the old TypeError cascade probed on every candle)
+_CALL_POSITIONAL = "positional"  # gen(snapshot)
+_CALL_KW_SNAPSHOT = "kw_snapshot"  # gen(candles_snapshot=snapshot)
+_CALL_EMPTY = "empty"  # gen()
+_CALL_BALANCE = "balance"  # gen(account_balance=...)
+
+
+def _accepts(
+    params: Sequence[inspect.Parameter], *, positional: int, kw: tuple
+) -> bool:
+    """Whether a call with `positional` args and keywords `kw` binds to `params`."""
+    args = [object()] * positional
+    try:
+        inspect.Signature(params).bind(*args, **{k: None for k in kw})
+    except TypeError:
+        return False
+    return True
+
+
+def _generator_call_mode(gen: Any) -> Optional[str]:
+    """Call mode for `gen`, or None when its signature cannot be read."""
+    try:
+        params = list(inspect.signature(gen).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    if _accepts(params, positional=1, kw=()):
+        return _CALL_POSITIONAL
+    if _accepts(params, positional=0, kw=("candles_snapshot",)):
+        return _CALL_KW_SNAPSHOT
+    if _accepts(params, positional=0, kw=()):
+        return _CALL_EMPTY
+    if _accepts(params, positional=0, kw=("account_balance",)):
+        return _CALL_BALANCE
+    return None
+
+
+def _place_side_keyword(place: Any) -> Optional[str]:
+    """'side' or 'signal', whichever broker.place_* takes; None if unknown."""
+    try:
+        params = list(inspect.signature(place).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    for kw in ("side", "signal"):
+        if _accepts(params, positional=0, kw=("symbol", kw)):
+            return kw
+    return None
+
 
 def create_orchestrator(
     collector: Any,
@@ -19,6 +83,7 @@ def create_orchestrator(
     exit_trade: Optional[Any] = None,
     enter_trade: Optional[Any] = None,
     logger: Optional[Any] = None,
+    executor: Optional[Executor] = None,
 ) -> "SignalOrchestrator":
     """
     Provider that creates and returns a SignalOrchestrator.
@@ -32,6 +97,7 @@ def create_orchestrator(
         exit_trade=exit_trade,
         enter_trade=enter_trade,
         logger=logger,
+        executor=executor,
     )
 
 
@@ -62,6 +128,7 @@ class SignalOrchestrator:
         enter_trade: Optional[Any] = None,
         logger: Optional[Any] = None,
         pending_entries: Optional[dict[str, dict]] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         self.collector = collector
         self.signal_generator = signal_generator
@@ -72,35 +139,41 @@ class SignalOrchestrator:
         self.exit_trade = exit_trade
         self.enter_trade = enter_trade
         self.logger = logger
+        self.executor = executor
 
         self._running: bool = False
         self._thread: Optional[threading.Thread] = None
+        self._future: Optional[Future] = None
+        # Per-run stop flag; a loop left over from a timed-out stop() keeps
+        # its own (set) flag and exits even after a restart
+        self._run_stopped = threading.Event()
 
         self._last_closed_time_by_symbol: Dict[str, datetime] = {}
+        # Last snapshot object seen per symbol; collectors that publish an
+        # immutable snapshot hand back the same object until a bar closes
+        self._last_snapshot_by_symbol: Dict[Optional[str], Any] = {}
+        # (flag key this feed uses, higher-precedence keys), learned on first hit
+        self._closed_probe: Optional[tuple] = None
 
         self._tf_entry: int = int(
-            getattr(
-                signal_generator,
-                "tf_entry",
-                getattr(Config, "TF_ENTRY", mt5.TIMEFRAME_M1),
-            )
+            getattr(signal_generator, "tf_entry", Config.TF_ENTRY)
         )
         self._tf_confirm: int = int(
-            getattr(
-                signal_generator,
-                "tf_confirm",
-                getattr(Config, "TF_CONFIRM", mt5.TIMEFRAME_M5),
-            )
-        )
-        self._tf_bias: int = int(
-            getattr(
-                signal_generator,
-                "tf_bias",
-                getattr(Config, "TF_BIAS", mt5.TIMEFRAME_M15),
-            )
+            getattr(signal_generator, "tf_confirm", Config.TF_CONFIRM)
         )
+        self._tf_bias: int = int(getattr(signal_generator, "tf_bias", Config.TF_BIAS))
         self.pending_entries: Dict[str, dict] = pending_entries or {}
 
+        # Written only by the producer (one reference assignment), read lock-free
+        self._latest_signal: Optional[dict] = None
+        # Last tick pushed by the tick collector (same lock-free pattern)
+        self._last_tick: Any = None
+        # Set by _on_tick when a tick opens a new minute (and by stop())
+        self._bar_event = threading.Event()
+        self._last_tick_minute: Optional[int] = None
+
+        self._resolve_callables()
+
     # -------------------------
     # Lifecycle
     # -------------------------
@@ -110,19 +183,96 @@ class SignalOrchestrator:
             return
 
         self._safe_call(self.collector, "start")
+        self._resolve_callables()
         self._wire_tick_callback()
 
         self._running = True
+        stopped = self._run_stopped = threading.Event()
+        if self.executor is not None:
+            # Shared pool: the candle loop runs on a reused worker thread
+            self._future = self.executor.submit(self._run, stopped)
+            return
         self._thread = threading.Thread(
-            target=self._run, name="SignalOrchestrator", daemon=True
+            target=self._run, args=(stopped,), name="SignalOrchestrator", daemon=True
         )
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        self._run_stopped.set()
+        self._bar_event.set()  # wake the candle loop so it can exit
+        self._wait_for_loop()
         self._safe_call(self.tick_collector, "stop")
         self._safe_call(self.collector, "stop")
 
+    def _wait_for_loop(self) -> None:
+        """Let the current candle loop finish so start() never runs two."""
+        future, self._future = self._future, None
+        if future is not None and not future.cancel():
+            try:
+                future.result(timeout=_STOP_TIMEOUT_SECONDS)
+            except Exception as exc:
+                self._log(f"[Orchestrator] candle loop did not stop cleanly: {exc!r}")
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(_STOP_TIMEOUT_SECONDS)
+
+    def _resolve_callables(self) -> None:
+        """
+        Bind the dependency methods used per tick / per candle once; the
+        wired objects do not change while the orchestrator runs.
+        """
+        sg = self.signal_generator
+        gen = (
+            getattr(sg, "generate_signal", None)
+            or getattr(sg, "generate_signals", None)
+            or getattr(sg, "__call__", None)
+        )
+        self._gen_fn = gen if callable(gen) else None
+        self._gen_call_mode = (
+            _generator_call_mode(self._gen_fn) if self._gen_fn is not None else None
+        )
+        self._sg_on_new_tick = getattr(sg, "on_new_tick", None)
+        self._get_confirmed = getattr(sg, "get_confirmed_signal", None)
+
+        proc = getattr(self.trading_service, "process_signal", None)
+        self._proc_fn = proc if self.trading_service and callable(proc) else None
+
+        enter = (
+            getattr(self.enter_trade, "on_signal", None)
+            or getattr(self.enter_trade, "execute", None)
+            or getattr(self.enter_trade, "enter", None)
+        )
+        self._enter_fn = enter if self.enter_trade and callable(enter) else None
+
+        place = (
+            getattr(self.broker, "place_market_order", None)
+            or getattr(self.broker, "place_order", None)
+            or getattr(self.broker, "open_position", None)
+        )
+        self._place_fn = place if self.broker and callable(place) else None
+        self._place_side_kw = (
+            _place_side_keyword(self._place_fn) if self._place_fn is not None else None
+        )
+
+        et = self.exit_trade
+        on_tick = getattr(et, "on_tick", None)
+        on_close = getattr(et, "on_candle_close", None)
+        self._on_tick_exit = on_tick if et and callable(on_tick) else None
+        self._on_close_exit = on_close if et and callable(on_close) else None
+
+    def get_latest_signal(self) -> Optional[dict]:
+        """Latest generated signal (plain attribute read, no locking)."""
+        return self._latest_signal
+
+    def get_tick(self) -> Any:
+        """
+        Last tick seen by the tick callback; no MT5 round-trip. The only
+        other tick lookup is the candle collectors' hourly server clock
+        offset refresh.
+        """
+        return self._last_tick
+
     # -------------------------
     # Tick path (protective exits + n-tick logic)
     # -------------------------
@@ -169,10 +319,21 @@ class SignalOrchestrator:
                 )
 
     def _on_tick(self, tick: Any) -> None:
+        self._last_tick = tick
+
+        # A tick in a new minute means a bar just closed: wake the candle loop
+        tick_time = getattr(tick, "time", None)
+        if tick_time is not None:
+            minute = int(tick_time) // 60
+            if minute != self._last_tick_minute:
+                self._last_tick_minute = minute
+                self._bar_event.set()
+
         # 1. Run protective exits
-        if self.exit_trade:
+        on_tick_exit = self._on_tick_exit
+        if on_tick_exit is not None:
             try:
-                actions = self.exit_trade.on_tick(tick)
+                actions = on_tick_exit(tick)
             except Exception as exc:
                 self._log_exception(f"[Orchestrator] exit_trade.on_tick error: {exc!r}")
                 actions = []
@@ -180,35 +341,31 @@ class SignalOrchestrator:
                 self._execute_exit_actions(actions)
 
         # 2. Forward tick to n-tick confirmation logic (signal_generator handles tick logic)
-        if hasattr(self.signal_generator, "on_new_tick"):
+        on_new_tick = self._sg_on_new_tick
+        if on_new_tick is not None:
             try:
                 price = getattr(tick, "bid", None) or getattr(tick, "last", None)
                 spread_points = getattr(tick, "spread", None)
-                self.signal_generator.on_new_tick(price, spread_points)
+                on_new_tick(price, spread_points)
             except Exception as exc:
                 self._log_exception(
                     f"[Orchestrator] signal_generator.on_new_tick error: {exc!r}"
                 )
         # Prefer trading_service for entries if available
-        if hasattr(self.signal_generator, "get_confirmed_signal"):
-            sig = self.signal_generator.get_confirmed_signal()
+        if self._get_confirmed is not None:
+            sig = self._get_confirmed()
             if sig and (sig.get("final_signal") in ("buy", "sell")):
-                if self.trading_service and hasattr(
-                    self.trading_service, "process_signal"
-                ):
+                self._latest_signal = dict(sig)
+                if self._proc_fn is not None:
                     try:
-                        self.trading_service.process_signal([sig], None)
+                        self._proc_fn([sig], None)
                     except Exception as exc:
                         self._log_exception(
                             f"[Orchestrator] trading_service.process_signal error: {exc!r}"
                         )
                 elif self.enter_trade:
-                    fn = (
-                        getattr(self.enter_trade, "on_signal", None)
-                        or getattr(self.enter_trade, "execute", None)
-                        or getattr(self.enter_trade, "enter", None)
-                    )
-                    if callable(fn):
+                    fn = self._enter_fn
+                    if fn is not None:
                         try:
                             fn(sig)
                         except Exception as exc:
@@ -226,10 +383,13 @@ class SignalOrchestrator:
     # Candle loop (entries + candle-close profit exits)
     # -------------------------
 
-    def _run(self) -> None:
+    def _run(self, stopped: threading.Event) -> None:
         poll_sleep = min(float(getattr(self.collector, "interval", 1) or 1), 0.05)
+        # Without a tick feed nothing sets the event; keep the plain poll
+        idle_wait = _IDLE_WAIT_SECONDS if self.tick_collector else poll_sleep
+        catch_up_until = 0.0
 
-        while self._running:
+        while not stopped.is_set():
             try:
                 symbols = self._symbols_to_process()
                 did_work = False
@@ -238,6 +398,9 @@ class SignalOrchestrator:
                     snapshot = self._get_latest_candles(symbol=symbol)
                     if not snapshot:
                         continue
+                    if snapshot is self._last_snapshot_by_symbol.get(symbol):
+                        continue
+                    self._last_snapshot_by_symbol[symbol] = snapshot
 
                     entry_candles = self._extract_tf_candles(snapshot, self._tf_entry)
                     closed_candle = self._last_closed_candle(entry_candles)
@@ -273,11 +436,16 @@ class SignalOrchestrator:
                         closed_time=closed_time,
                     )
 
-                time.sleep(0.1 if did_work else poll_sleep)
+                if did_work:
+                    catch_up_until = 0.0
+                timeout = poll_sleep if time.monotonic() < catch_up_until else idle_wait
+                if self._bar_event.wait(timeout):
+                    self._bar_event.clear()
+                    catch_up_until = time.monotonic() + _CATCH_UP_SECONDS
 
             except Exception as exc:
                 self._log_exception(f"[Orchestrator] loop error: {exc!r}")
-                time.sleep(1)
+                self._bar_event.wait(1)
 
     def _run_candle_close_profit_exits(
         self,
@@ -286,19 +454,13 @@ class SignalOrchestrator:
         closed_candle: Optional[dict],
         closed_time: datetime,
     ) -> None:
-        if not self.exit_trade:
-            return
-
-        on_close = getattr(self.exit_trade, "on_candle_close", None)
-        if not callable(on_close):
+        on_close = self._on_close_exit
+        if on_close is None:
             return
 
-        close_px = None
-        if isinstance(closed_candle, dict):
-            close_px = closed_candle.get("close")
-
+        # Missing key, None or non-dict all land in the except path
         try:
-            close_px_f = float(close_px) if close_px is not None else None
+            close_px_f = float(closed_candle["close"])
         except Exception:
             close_px_f = None
 
@@ -321,46 +483,16 @@ class SignalOrchestrator:
             self._execute_exit_actions(actions)
 
     def _run_entries(self, *, snapshot: Any, asof: datetime) -> None:
-        sg = self.signal_generator
-
-        # Accept multiple generator APIs (backwards/forwards compatible)
-        gen = (
-            getattr(sg, "generate_signal", None)
-            or getattr(sg, "generate_signals", None)
-            or getattr(sg, "__call__", None)
-        )
-        if not callable(gen):
+        # Accept multiple generator APIs (resolved once in _resolve_callables)
+        gen = self._gen_fn
+        if gen is None:
             self._log(
-                f"[Orchestrator] signal_generator has no callable generate_signal()/generate_signals()/__call__: {type(sg).__name__}"
+                f"[Orchestrator] signal_generator has no callable generate_signal()/generate_signals()/__call__: {type(self.signal_generator).__name__}"
             )
             return
 
-        # Call the generator with best-effort signature matching
         try:
-            try:
-                sig_out = gen(snapshot)
-            except TypeError:
-                try:
-                    sig_out = gen(candles_snapshot=snapshot)
-                except TypeError:
-                    try:
-                        sig_out = gen()
-                    except TypeError:
-                        # Last fallback: some generators use account_balance; try to fetch from broker if possible
-                        bal = None
-                        get_bal = (
-                            getattr(self.broker, "get_account_balance", None)
-                            if self.broker
-                            else None
-                        )
-                        if callable(get_bal):
-                            try:
-                                bal = float(get_bal())
-                            except Exception:
-                                bal = None
-                        if bal is None:
-                            raise
-                        sig_out = gen(account_balance=bal)
+            sig_out = self._call_generator(gen, snapshot)
         except Exception as exc:
             self._log_exception(f"[Orchestrator] signal generator call failed: {exc!r}")
             return
@@ -381,6 +513,9 @@ class SignalOrchestrator:
             self._log("[Orchestrator] signal generator returned 0 dict signals")
             return
 
+        # Publish a private copy so readers never see later in-place edits
+        self._latest_signal = dict(signals[-1])
+
         self._log(
             f"[Orchestrator] signals={len(signals)} asof={asof.isoformat()} sample={signals[0]}"
         )
@@ -405,8 +540,8 @@ class SignalOrchestrator:
 
         # If trading_service exists, let it handle execution
         if self.trading_service:
-            proc = getattr(self.trading_service, "process_signal", None)
-            if callable(proc):
+            proc = self._proc_fn
+            if proc is not None:
                 try:
                     proc(signals, snapshot)
                 except Exception as exc:
@@ -433,12 +568,8 @@ class SignalOrchestrator:
                 continue  # Do not execute trade yet
 
             if self.enter_trade:
-                fn = (
-                    getattr(self.enter_trade, "on_signal", None)
-                    or getattr(self.enter_trade, "execute", None)
-                    or getattr(self.enter_trade, "enter", None)
-                )
-                if callable(fn):
+                fn = self._enter_fn
+                if fn is not None:
                     try:
                         fn(sig)
                         continue
@@ -450,12 +581,14 @@ class SignalOrchestrator:
             if not self.broker:
                 continue
 
-            place = (
-                getattr(self.broker, "place_market_order", None)
-                or getattr(self.broker, "place_order", None)
-                or getattr(self.broker, "open_position", None)
-            )
-            if callable(place):
+            place = self._place_fn
+            side_kw = self._place_side_kw
+            if place is not None and side_kw is not None:
+                try:
+                    place(symbol=str(symbol), **{side_kw: final_signal})
+                except Exception as exc:
+                    self._log_exception(f"[Orchestrator] broker.place_* error: {exc!r}")
+            elif place is not None:
                 try:
                     place(symbol=str(symbol), side=final_signal)
                 except TypeError:
@@ -468,6 +601,49 @@ class SignalOrchestrator:
                 except Exception as exc:
                     self._log_exception(f"[Orchestrator] broker.place_* error: {exc!r}")
 
+    def _call_generator(self, gen: Any, snapshot: Any) -> Any:
+        mode = self._gen_call_mode
+        if mode == _CALL_POSITIONAL:
+            return gen(snapshot)
+        if mode == _CALL_KW_SNAPSHOT:
+            return gen(candles_snapshot=snapshot)
+        if mode == _CALL_EMPTY:
+            return gen()
+        if mode == _CALL_BALANCE:
+            bal = self._account_balance()
+            if bal is None:
+                raise RuntimeError("signal generator needs account_balance")
+            return gen(account_balance=bal)
+
+        # Signature not inspectable: probe with best-effort signature matching
+        try:
+            return gen(snapshot)
+        except TypeError:
+            pass
+        try:
+            return gen(candles_snapshot=snapshot)
+        except TypeError:
+            pass
+        try:
+            return gen()
+        except TypeError:
+            # Last fallback: some generators use account_balance
+            bal = self._account_balance()
+            if bal is None:
+                raise
+            return gen(account_balance=bal)
+
+    def _account_balance(self) -> Optional[float]:
+        get_bal = (
+            getattr(self.broker, "get_account_balance", None) if self.broker else None
+        )
+        if not callable(get_bal):
+            return None
+        try:
+            return float(get_bal())
+        except Exception:
+            return None
+
     # -------------------------
     # Broker execution helpers
     # -------------------------
@@ -475,8 +651,15 @@ class SignalOrchestrator:
     def _execute_exit_actions(self, actions: List[Any]) -> None:
         # Prefer trading_service (TradeExecutor) for exits if available
         if self.trading_service and hasattr(self.trading_service, "execute_exit"):
+            # Several exits in one pass: one bulk positions fetch instead of a
+            # per-ticket terminal lookup inside each execute_exit
+            by_ticket = self._open_positions_by_ticket() if len(actions) > 1 else {}
             for a in actions:
-                self.trading_service.execute_exit(a)
+                position = by_ticket.get(getattr(a, "ticket", None))
+                if position is not None:
+                    self.trading_service.execute_exit(a, position=position)
+                else:
+                    self.trading_service.execute_exit(a)
             return
 
         # Fallback: call broker directly
@@ -524,6 +707,21 @@ class SignalOrchestrator:
             except Exception:
                 pass
 
+    def _open_positions_by_ticket(self) -> Dict[Any, Any]:
+        getter = getattr(self.broker, "get_open_positions", None)
+        if not callable(getter):
+            return {}
+        try:
+            positions = getter() or ()
+        except Exception:
+            return {}
+        by_ticket: Dict[Any, Any] = {}
+        for p in positions:
+            ticket = getattr(p, "ticket", None)
+            if ticket is not None:
+                by_ticket[ticket] = p
+        return by_ticket
+
     # -------------------------
     # Candle snapshot helpers
     # -------------------------
@@ -533,9 +731,9 @@ class SignalOrchestrator:
         if sym:
             return [str(sym)]
 
-        syms = getattr(Config, "SYMBOLS", None)
-        if isinstance(syms, list) and syms:
-            max_syms = int(getattr(Config, "MAX_SYMBOLS", len(syms)) or len(syms))
+        syms = Config.SYMBOLS
+        if syms:
+            max_syms = int(Config.MAX_SYMBOLS or len(syms))
             return [str(s) for s in syms[:max_syms] if s]
         return []
 
@@ -553,15 +751,15 @@ class SignalOrchestrator:
         except Exception:
             return None
 
-    def _extract_tf_candles(self, snapshot: Any, tf: int) -> List[dict]:
+    def _extract_tf_candles(self, snapshot: Any, tf: int) -> Sequence[dict]:
         if isinstance(snapshot, dict):
             v = snapshot.get(int(tf), []) or []
-            return v if isinstance(v, list) else []
-        if isinstance(snapshot, list):
+            return v if isinstance(v, (list, tuple)) else []
+        if isinstance(snapshot, (list, tuple)):
             return snapshot
         return []
 
-    def _last_closed_candle(self, candles: List[dict]) -> Optional[dict]:
+    def _last_closed_candle(self, candles: Sequence[dict]) -> Optional[dict]:
         if not candles:
             return None
 
@@ -572,9 +770,27 @@ class SignalOrchestrator:
         return candles[-2] if len(candles) >= 2 else candles[-1]
 
     def _is_candle_closed(self, candle: dict) -> bool:
-        for k in ("is_closed", "closed", "complete", "is_complete"):
-            if k in candle:
-                return bool(candle.get(k))
+        # Fast path: a feed stamps every candle with the same flag, so probe that
+        # key first (one .get for "is_closed", the common case)
+        probe = self._closed_probe
+        if probe is not None:
+            key, higher = probe
+            v = candle.get(key, _MISSING)
+            if v is not _MISSING and not any(k in candle for k in higher):
+                return bool(v)
+
+        hit = _CLOSED_KEYS.intersection(candle)
+        if not hit:
+            return True
+        if len(hit) == 1:
+            key = next(iter(hit))
+            i = _CLOSED_KEY_ORDER.index(key)
+            self._closed_probe = (key, _CLOSED_KEY_ORDER[:i])
+            return bool(candle[key])
+        # Several flags present: keep the documented precedence
+        for k in _CLOSED_KEY_ORDER:
+            if k in hit:
+                return bool(candle[k])
         return True
 
     def _resolve_symbol_from_candle_or_fallback(
@@ -637,7 +853,7 @@ class SignalOrchestrator:
             if self.logger and hasattr(self.logger, "info"):
                 self.logger.info(msg)
             else:
-                print(msg)
+                _logger.info(msg)
         except Exception:
             pass
 
@@ -646,6 +862,6 @@ class SignalOrchestrator:
             if self.logger and hasattr(self.logger, "exception"):
                 self.logger.exception(msg)
             else:
-                print(msg)
+                _logger.exception(msg)
         except Exception:
             pass
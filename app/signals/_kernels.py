@@ -0,0 +1,66 @@
+"""
+Numeric kernels for the indicators.
+
+numba is not a declared dependency, so by default the decorator below is a
+no-op and these run as plain Python loops. Installing numba compiles them in
+place. Callers coerce the results with float()/bool(), so either path hands
+back builtin types.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def wilder_rsi_kernel(closes: np.ndarray, period: int) -> float:
+    """Latest Wilder-smoothed RSI of a float64 closes array (len >= period + 1)."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = closes[i] - closes[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    # Smoothing runs from the second delta, as calculate_rsi always has
+    for i in range(2, len(closes)):
+        d = closes[i] - closes[i - 1]
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+
+    rs = avg_gain / (avg_loss + 1e-8)
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def pullback_completed_kernel(closes: np.ndarray) -> bool:
+    """
+    Last close above the 20-bar SMA after at least one of the five closes
+    before that window was below it.
+    """
+    n = closes.shape[0]
+    if n < 21:
+        return False
+    acc = 0.0
+    for i in range(n - 20, n):
+        acc += closes[i]
+    sma20 = acc / 20.0
+    if not closes[n - 1] > sma20:
+        return False
+    for i in range(max(0, n - 25), n - 20):
+        if closes[i] < sma20:
+            return True
+    return False
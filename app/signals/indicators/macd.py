@@ -1,11 +1,43 @@
 import logging
 import pandas as pd
 
+from app.signals.indicators.prices import accepts_closes, close_array
+
 
 def calculate_ema(data, span: int):
     return pd.Series(data).ewm(span=int(span), adjust=False).mean()
 
 
+def calculate_macd_lines(
+    closes,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+    *,
+    with_emas: bool = False,
+):
+    """
+    MACD and signal line in one pass over a single closes Series.
+    Returns (macd_line, signal_line) as float64 arrays, followed by the fast
+    and slow EMAs when `with_emas` is set (StreamingMACD seeds its state
+    from them).
+    """
+    series = pd.Series(closes, dtype="float64")
+    ema_fast = series.ewm(span=fast_period, adjust=False).mean()
+    ema_slow = series.ewm(span=slow_period, adjust=False).mean()
+    macd_line = ema_fast - ema_slow
+    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+    if with_emas:
+        return (
+            macd_line.to_numpy(),
+            signal_line.to_numpy(),
+            ema_fast.to_numpy(),
+            ema_slow.to_numpy(),
+        )
+    return macd_line.to_numpy(), signal_line.to_numpy()
+
+
+@accepts_closes
 def calculate_macd(
     data,
     *,
@@ -20,9 +52,7 @@ def calculate_macd(
     log = logger or logging.getLogger(__name__)
 
     try:
-        closing_prices = [
-            item["close"] for item in data if item.get("close") is not None
-        ]
+        closing_prices = close_array(data)
 
         slow_period = int(slow_period)
         fast_period = int(fast_period)
@@ -35,36 +65,130 @@ def calculate_macd(
             log.error("Insufficient data for MACD calculation.")
             return "hold"
 
-        ema_fast = calculate_ema(closing_prices, fast_period)
-        ema_slow = calculate_ema(closing_prices, slow_period)
-        macd_line = ema_fast - ema_slow
-        signal_line = calculate_ema(macd_line, signal_period)
+        macd_line, signal_line = calculate_macd_lines(
+            closing_prices, fast_period, slow_period, signal_period
+        )
 
-        if len(macd_line) < 2 or len(signal_line) < 2:
+        # Both lines are equal-length ndarrays from the same closes
+        if macd_line.size < 2:
             log.error("Insufficient MACD or Signal Line points calculated.")
             return "hold"
 
-        macd_last = float(macd_line.iloc[-1])
-        signal_last = float(signal_line.iloc[-1])
+        log.info("MACD: %.10f, SignalLine: %.10f", macd_line[-1], signal_line[-1])
 
-        log.info(
-            "MACD: %.10f, SignalLine: %.10f",
-            macd_last,
-            signal_last,
-        )
-
-        # Calculate the current and previous histogram values
-        hist_last = macd_last - signal_last
-        hist_prev = float(macd_line.iloc[-2]) - float(signal_line.iloc[-2])
+        # Current and previous histogram values in one vector op on the tail
+        hist_prev, hist_last = (macd_line[-2:] - signal_line[-2:]).tolist()
 
-        # Histogram logic: Buy only if positive AND growing (accelerating)
-        if hist_last > 0 and hist_last > hist_prev:
-            return "buy"
-        elif hist_last < 0 and hist_last < hist_prev:
-            return "sell"
-        else:
-            return "hold"
+        return _histogram_signal(hist_last, hist_prev)
 
     except Exception as e:
         log.error("Error in calculate_macd: %s", str(e))
         return "hold"
+
+
+# Indexed by +1/0/-1 ("sell" via index -1)
+_SIGNAL_BY_SIGN = ("hold", "buy", "sell")
+
+
+def _histogram_signal(hist_last: float, hist_prev: float) -> str:
+    # Histogram logic: Buy only if positive AND growing (accelerating),
+    # sell only if negative AND falling; both terms are bools, so no branches
+    up = (hist_last > 0) & (hist_last > hist_prev)
+    down = (hist_last < 0) & (hist_last < hist_prev)
+    return _SIGNAL_BY_SIGN[up - down]
+
+
+class StreamingMACD:
+    """
+    MACD indicator that carries its EMA state between calls.
+
+    When the window has advanced by exactly one bar since the previous call,
+    the EMAs take a single recursion step on the new close instead of being
+    recomputed over the whole window. Anything else (first call, gap, reload)
+    falls back to a full recompute, which re-seeds the state.
+
+    State is kept per (symbol, bar spacing), so one instance can serve the
+    M1/M5/M15 windows of the multi-timeframe strategy.
+    """
+
+    _MAX_STREAMS = 8
+
+    def __init__(
+        self,
+        *,
+        fast_period: int = 7,
+        slow_period: int = 16,
+        signal_period: int = 5,
+        logger: logging.Logger | None = None,
+    ):
+        self.fast_period = int(fast_period)
+        self.slow_period = int(slow_period)
+        self.signal_period = int(signal_period)
+        self.logger = logger or logging.getLogger(__name__)
+        self._alpha_fast = 2.0 / (self.fast_period + 1)
+        self._alpha_slow = 2.0 / (self.slow_period + 1)
+        self._alpha_signal = 2.0 / (self.signal_period + 1)
+        # stream key -> (last_time, ema_fast, ema_slow, signal, hist)
+        self._state: dict[tuple, tuple] = {}
+
+    def __call__(self, data) -> str:
+        try:
+            last, prev = data[-1], data[-2]
+            key = (last.get("symbol"), last["time"] - prev["time"])
+            last_close = float(last["close"])
+        except Exception:
+            # Arrays, short windows or odd candles: stateless path
+            return self._recompute(data, None)
+
+        st = self._state.get(key)
+        if st is None or st[0] != prev["time"]:
+            return self._recompute(data, key)
+
+        _, ema_fast, ema_slow, sig, hist_prev = st
+        ema_fast += self._alpha_fast * (last_close - ema_fast)
+        ema_slow += self._alpha_slow * (last_close - ema_slow)
+        macd = ema_fast - ema_slow
+        sig += self._alpha_signal * (macd - sig)
+        hist_last = macd - sig
+        self._state[key] = (last["time"], ema_fast, ema_slow, sig, hist_last)
+
+        self.logger.info("MACD: %.10f, SignalLine: %.10f", macd, sig)
+        return _histogram_signal(hist_last, hist_prev)
+
+    def _recompute(self, data, key) -> str:
+        if key is None or len(data) < self.slow_period:
+            return calculate_macd(
+                data,
+                fast_period=self.fast_period,
+                slow_period=self.slow_period,
+                signal_period=self.signal_period,
+                logger=self.logger,
+            )
+
+        try:
+            macd_line, signal_line, ema_fast, ema_slow = calculate_macd_lines(
+                close_array(data),
+                self.fast_period,
+                self.slow_period,
+                self.signal_period,
+                with_emas=True,
+            )
+            hist_prev, hist_last = (macd_line[-2:] - signal_line[-2:]).tolist()
+        except Exception as e:
+            self.logger.error("Error in StreamingMACD: %s", str(e))
+            return "hold"
+
+        if len(self._state) >= self._MAX_STREAMS:
+            self._state.clear()
+        self._state[key] = (
+            data[-1]["time"],
+            float(ema_fast[-1]),
+            float(ema_slow[-1]),
+            float(signal_line[-1]),
+            hist_last,
+        )
+
+        self.logger.info(
+            "MACD: %.10f, SignalLine: %.10f", float(macd_line[-1]), signal_line[-1]
+        )
+        return _histogram_signal(hist_last, hist_prev)
@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def close_array(data) -> np.ndarray:
+    """
+    Closing prices as a contiguous float64 array.
+
+    Accepts either a list of candle dicts (candles without a close are skipped)
+    or an already-extracted array of closes, which is returned as-is so callers
+    can convert a window once and share it across indicators.
+    """
+    if isinstance(data, np.ndarray):
+        return data
+    return np.fromiter(
+        (c["close"] for c in data if c.get("close") is not None),
+        dtype=np.float64,
+    )
+
+
+def accepts_closes(fn):
+    """
+    Mark an indicator as able to take a closes array in place of candle dicts,
+    so a strategy can extract the window's closes once and share them.
+    """
+    fn.accepts_closes = True
+    return fn
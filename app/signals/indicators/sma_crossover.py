@@ -1,11 +1,14 @@
 import logging
 import numpy as np
 
+from app.signals.indicators.prices import accepts_closes, close_array
+
 
 def calculate_sma(data, window_size):
     return np.convolve(data, np.ones(window_size), "valid") / window_size
 
 
+@accepts_closes
 def generate_sma_signal(
     data,
     *,
@@ -29,9 +32,7 @@ def generate_sma_signal(
             )
             return "hold"
 
-        closing_prices = [
-            item["close"] for item in data if item.get("close") is not None
-        ]
+        closing_prices = close_array(data)
         short_sma = calculate_sma(closing_prices, short_window)
         long_sma = calculate_sma(closing_prices, long_window)
 
@@ -4,7 +4,7 @@ import MetaTrader5 as mt5
 from app.config.settings import Config
 from app.utils.configure_logging import logger as default_logger
 from app.signals.indicators.sma_crossover import generate_sma_signal as default_sma_fn
-from app.signals.indicators.macd import calculate_macd as default_macd_fn
+from app.signals.indicators.macd import StreamingMACD
 from app.signals.indicators.rsi import calculate_rsi as default_rsi_fn
 
 from app.signals.strategies.strong_signal_strategy import StrongSignalStrategy
@@ -51,7 +51,7 @@ def strategy_factory(
     if indicators is None:
         indicators = {
             # "sma": default_sma_fn,
-            "macd": default_macd_fn,
+            "macd": StreamingMACD(),
             # "rsi": default_rsi_fn,
         }
 
@@ -1,8 +1,15 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import MetaTrader5 as mt5
+import numpy as np
+from app.signals._kernels import pullback_completed_kernel
 from app.signals.strategies.base_signal_strategy import BaseSignalStrategy
 from app.signals.strategies.strong_signal_strategy import StrongSignalStrategy
 
+# MT5 timeframe constants bound once at import
+_M1 = int(mt5.TIMEFRAME_M1)
+_M5 = int(mt5.TIMEFRAME_M5)
+_M15 = int(mt5.TIMEFRAME_M15)
+
 
 class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
     """
@@ -14,48 +21,68 @@ class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
     Output is a single final_signal ("buy"/"sell"/"hold") plus per-TF signals.
     """
 
+    __slots__ = (
+        "base",
+        "tf_bias",
+        "tf_confirm",
+        "tf_entry",
+        "_tf_cache",
+        "_last_key",
+        "_last_result",
+    )
+
     def __init__(
         self,
         *,
         base: StrongSignalStrategy,
-        tf_bias: int = mt5.TIMEFRAME_M15,
-        tf_confirm: int = mt5.TIMEFRAME_M5,
-        tf_entry: int = mt5.TIMEFRAME_M1,
+        tf_bias: int = _M15,
+        tf_confirm: int = _M5,
+        tf_entry: int = _M1,
     ):
         self.base = base
         self.tf_bias = int(tf_bias)
         self.tf_confirm = int(tf_confirm)
         self.tf_entry = int(tf_entry)
 
+        # tf -> ((last candle time, len), base result); one entry per timeframe
+        self._tf_cache: Dict[int, tuple] = {}
+        # Whole-output memo: unchanged bias, confirm and entry windows -> same result
+        self._last_key: Optional[tuple] = None
+        self._last_result: Optional[dict] = None
+
     def generate_signal(self, candles_by_tf: Dict[int, List[dict]]) -> dict:
-        # Accept collectors that key by int (1/5/15) OR by strings ("m1"/"m5"/"m15"/"1"/"5"/"15")
-        lower_map: Dict[str, Any] = {
-            str(k).lower(): v for k, v in (candles_by_tf or {}).items()
-        }
+        by_tf = candles_by_tf or {}
+        tf_bias, tf_confirm, tf_entry = self.tf_bias, self.tf_confirm, self.tf_entry
 
-        def _get(tf: int) -> List[dict]:
-            if candles_by_tf and tf in candles_by_tf:
-                return candles_by_tf.get(tf, []) or []
-            # string versions
-            v = lower_map.get(str(tf).lower())
-            if v is not None:
-                return v or []
-            v = lower_map.get(f"m{int(tf)}")
-            if v is not None:
-                return v or []
-            return []
-
-        c_bias = _get(self.tf_bias)
-        c_conf = _get(self.tf_confirm)
-        c_entry = _get(self.tf_entry)
+        # Fast path: collectors key by the MT5 timeframe ints
+        if tf_bias in by_tf and tf_confirm in by_tf and tf_entry in by_tf:
+            c_bias = by_tf[tf_bias] or []
+            c_conf = by_tf[tf_confirm] or []
+            c_entry = by_tf[tf_entry] or []
+        else:
+            # Accept collectors that key by int (1/5/15) OR by strings ("m1"/"m5"/"m15"/"1"/"5"/"15")
+            lower_map: Dict[str, Any] = {str(k).lower(): v for k, v in by_tf.items()}
+            c_bias = self._get_tf(by_tf, lower_map, tf_bias)
+            c_conf = self._get_tf(by_tf, lower_map, tf_confirm)
+            c_entry = self._get_tf(by_tf, lower_map, tf_entry)
+
+        key = tuple(
+            (c[-1].get("time"), len(c)) if c else None
+            for c in (c_bias, c_conf, c_entry)
+        )
+        # A newest candle without a time cannot tell two windows apart
+        if any(k is not None and k[0] is None for k in key):
+            key = None
+        elif key == self._last_key:
+            return self._last_result
 
         s_bias = (
-            self.base.generate_signal(c_bias, apply_entry_filters=False)
+            self._cached_base_signal(self.tf_bias, c_bias)
             if c_bias
             else {"final_signal": "hold", "raw_signal": "hold"}
         )
         s_conf = (
-            self.base.generate_signal(c_conf, apply_entry_filters=False)
+            self._cached_base_signal(self.tf_confirm, c_conf)
             if c_conf
             else {"final_signal": "hold", "raw_signal": "hold"}
         )
@@ -66,16 +93,17 @@ class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
         )
 
         # Resolve symbol early so early-returns are not "missing symbol"
+        # (base.generate_signal always returns a dict)
         symbol = (
-            (s_entry.get("symbol") if isinstance(s_entry, dict) else None)
-            or (s_conf.get("symbol") if isinstance(s_conf, dict) else None)
-            or (s_bias.get("symbol") if isinstance(s_bias, dict) else None)
+            s_entry.get("symbol")
+            or s_conf.get("symbol")
+            or s_bias.get("symbol")
             or self.base.config.SYMBOLS[0]
         )
 
         # If any timeframe returns an error or is waiting for a closed candle -> hold
         for s in (s_bias, s_conf, s_entry):
-            if isinstance(s, dict) and s.get("error"):
+            if s.get("error"):
                 return {
                     "symbol": symbol,
                     "final_signal": "hold",
@@ -83,7 +111,7 @@ class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
                     "reason": "tf_error",
                     "details": {"m15": s_bias, "m5": s_conf, "m1": s_entry},
                 }
-            if isinstance(s, dict) and s.get("reason") == "waiting_for_closed_candle":
+            if s.get("reason") == "waiting_for_closed_candle":
                 return {
                     "symbol": symbol,
                     "final_signal": "hold",
@@ -98,16 +126,15 @@ class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
         entry = (s_entry.get("final_signal", "hold") or "hold").lower()
 
         # --- Pullback logic: require pullback_completed for entry ---
-        c_entry = _get(self.tf_entry)
-        pullback_ok = self._pullback_completed(c_entry) if c_entry else False
+        # Only evaluated once all three timeframes agree on a side; on the
+        # common hold/disagree path it could not change the outcome, and the
+        # output reports None ("not evaluated") rather than False
+        aligned = bias == confirm == entry and entry in ("buy", "sell")
+        pullback_ok = self._pullback_completed(c_entry) if aligned and c_entry else None
 
-        final_signal = "hold"
-        if bias == "buy" and confirm == "buy" and entry == "buy" and pullback_ok:
-            final_signal = "buy"
-        elif bias == "sell" and confirm == "sell" and entry == "sell" and pullback_ok:
-            final_signal = "sell"
+        final_signal = entry if pullback_ok else "hold"
 
-        return {
+        result = {
             "symbol": symbol,
             "final_signal": final_signal,
             "raw_signal": final_signal,
@@ -118,13 +145,47 @@ class MultiTimeframeStrongSignalStrategy(BaseSignalStrategy):
             "pullback_completed": pullback_ok,
             "details": {"m15": s_bias, "m5": s_conf, "m1": s_entry},
         }
+        self._last_key = key
+        self._last_result = result
+        return result
+
+    @staticmethod
+    def _get_tf(
+        candles_by_tf: Dict[Any, List[dict]], lower_map: Dict[str, Any], tf: int
+    ) -> List[dict]:
+        if tf in candles_by_tf:
+            return candles_by_tf.get(tf, []) or []
+        # string versions
+        v = lower_map.get(str(tf).lower())
+        if v is not None:
+            return v or []
+        v = lower_map.get(f"m{int(tf)}")
+        if v is not None:
+            return v or []
+        return []
+
+    def _cached_base_signal(self, tf: int, candles: List[dict]) -> dict:
+        """
+        Base signal for a higher timeframe, reused until that timeframe's newest
+        candle changes. M15/M5 buffers only move every few M1 bars.
+        """
+        last_time = candles[-1].get("time")
+        if last_time is None:
+            # No time to tell two windows apart: always recompute
+            self._tf_cache.pop(tf, None)
+            return self.base.generate_signal(candles, apply_entry_filters=False)
+        key = (last_time, len(candles))
+        hit = self._tf_cache.get(tf)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        result = self.base.generate_signal(candles, apply_entry_filters=False)
+        self._tf_cache[tf] = (key, result)
+        return result
 
     def _pullback_completed(self, candles: list[dict]) -> bool:
-        # Example: last close above 20-period SMA after being below it
-        closes = [c["close"] for c in candles if "close" in c]
-        if len(closes) < 21:
-            return False
-        sma20 = sum(closes[-20:]) / 20
-        was_below = any(c < sma20 for c in closes[-25:-20])
-        now_above = closes[-1] > sma20
-        return was_below and now_above
+        # Example: last close above 20-period SMA after being below it.
+        # Only the last 25 bars matter, so never walk the full buffer.
+        closes = np.fromiter(
+            (c["close"] for c in candles[-25:] if "close" in c), dtype=np.float64
+        )
+        return bool(pullback_completed_kernel(closes))
@@ -1,6 +1,11 @@
+from collections import deque
 from typing import Optional, List, Any
 from app.signals.strategies.base_signal_strategy import BaseSignalStrategy
 
+# Pending side is kept as +1/-1 (0 = none); strings only at the boundary
+_DIRECTION = {"buy": 1, "sell": -1}
+_SIGNAL_BY_SIGN = ("hold", "buy", "sell")
+
 
 class NTickConfirmedSignalStrategy(BaseSignalStrategy):
     """
@@ -8,6 +13,24 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
     Only returns actionable buy/sell signals after n consecutive favorable ticks.
     """
 
+    __slots__ = (
+        "base",
+        "n_ticks",
+        "min_pip_move",
+        "max_spread_points",
+        "config",
+        "logger",
+        "liquidity_check_after_ntick",
+        "_pending_dir",
+        "_pending_entry_price",
+        "_tick_results",
+        "_waiting",
+        "_last_signal",
+        "_last_m1_signal_id",
+        "_confirmed_signal",
+        "_last_tick_price",
+    )
+
     def __init__(
         self,
         base_strategy: BaseSignalStrategy,
@@ -33,77 +56,90 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
         else:
             self.liquidity_check_after_ntick = True
 
-        self._pending_signal = None
+        self._pending_dir = 0
         self._pending_entry_price = None
-        self._tick_results = []
+        self._tick_results: deque[bool] = deque(maxlen=max(1, int(n_ticks)))
         self._waiting = False
         self._last_signal = None
         self._last_m1_signal_id = None
         self._confirmed_signal = None
+        self._last_tick_price = None
 
     def on_new_tick(self, price: float, spread_points: Optional[float] = None):
-        if not self._waiting or self._pending_signal not in ("buy", "sell"):
+        direction = self._pending_dir
+        if not self._waiting or not direction:
             return
-
-        if self.logger:
-            self.logger.info(
-                f"[NTick] on_new_tick: price={price}, spread_points={spread_points}, waiting={self._waiting}, pending_signal={self._pending_signal}"
+        pending = _SIGNAL_BY_SIGN[direction]
+        log = self.logger
+        min_move = self.min_pip_move
+
+        if log:
+            log.info(
+                "[NTick] on_new_tick: price=%s, spread_points=%s, waiting=%s, pending_signal=%s",
+                price,
+                spread_points,
+                self._waiting,
+                pending,
             )
 
         # Optional spread filter (before tick confirmation)
         if not self.liquidity_check_after_ntick:
             if self.max_spread_points is not None and spread_points is not None:
                 if spread_points > self.max_spread_points:
-                    self._tick_results = []
-                    if self.logger:
-                        self.logger.info(
-                            f"[NTick] Spread too high: {spread_points}, resetting tick results."
+                    self._tick_results.clear()
+                    if log:
+                        log.info(
+                            "[NTick] Spread too high: %s, resetting tick results.",
+                            spread_points,
                         )
                     self._last_tick_price = None
                     return
 
-        favorable = False
-        movement = 0.0
-        if not hasattr(self, "_last_tick_price") or self._last_tick_price is None:
+        if self._last_tick_price is None:
             self._last_tick_price = self._pending_entry_price
 
+        # buy: movement >= min_move; sell: movement <= -min_move
         movement = price - self._last_tick_price
-        if self._pending_signal == "buy":
-            favorable = movement >= self.min_pip_move
-        elif self._pending_signal == "sell":
-            favorable = movement <= -self.min_pip_move
+        favorable = movement * direction >= min_move
 
         if favorable:
             self._tick_results.append(True)
             self._last_tick_price = price
-            if self.logger:
-                self.logger.info(
-                    f"[NTick] Favorable tick: movement={movement}, tick_results={self._tick_results}"
+            if log:
+                log.info(
+                    "[NTick] Favorable tick: movement=%s, tick_results=%d/%d",
+                    movement,
+                    len(self._tick_results),
+                    self.n_ticks,
                 )
             if len(self._tick_results) == self.n_ticks:
-                if self.logger:
-                    self.logger.info(
-                        f"[NTick] {self.n_ticks} consecutive favorable ticks: confirming {self._pending_signal}."
+                if log:
+                    log.info(
+                        "[NTick] %s consecutive favorable ticks: confirming %s.",
+                        self.n_ticks,
+                        pending,
                     )
                 self._confirmed_signal = {
                     **(self._last_signal or {}),
-                    "final_signal": self._pending_signal,
+                    "final_signal": pending,
                     "reason": f"{self.n_ticks}_consecutive_favorable_ticks",
                     "entry_price": price,
                 }
                 self._reset()
         else:
-            if self.logger:
-                self.logger.info(
-                    f"[NTick] Unfavorable tick: movement={movement}, resetting tick counter."
+            if log:
+                log.info(
+                    "[NTick] Unfavorable tick: movement=%s, resetting tick counter.",
+                    movement,
                 )
-            self._tick_results = []
+            self._tick_results.clear()
             self._last_tick_price = self._pending_entry_price
 
     def generate_signal(self, candles: List[dict], *args, **kwargs):
         if self.logger:
             self.logger.info(
-                f"[NTick] generate_signal called. Confirmed signal buffer: {self._confirmed_signal}"
+                "[NTick] generate_signal called. Confirmed signal buffer: %s",
+                self._confirmed_signal,
             )
 
         # 1. Return buffered confirmed signal if present
@@ -115,6 +151,7 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
         # 2. Get base signal for this candle
         signal = self.base.generate_signal(candles, *args, **kwargs)
         raw_signal = signal.get("final_signal", "hold")
+        direction = _DIRECTION.get(raw_signal, 0)
         last_candle = candles[-1] if candles else None
         last_close = last_candle.get("close") if last_candle else None
         m1_signal_id = last_candle.get("time") if last_candle else None
@@ -123,21 +160,26 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
         if m1_signal_id != self._last_m1_signal_id:
             if self.logger:
                 self.logger.info(
-                    f"[NTick] Hard reset on new M1 signal: {m1_signal_id} (was {self._last_m1_signal_id})"
+                    "[NTick] Hard reset on new M1 signal: %s (was %s)",
+                    m1_signal_id,
+                    self._last_m1_signal_id,
                 )
             self._reset()
             self._last_m1_signal_id = m1_signal_id
 
         # 4. Start n-tick confirmation if new buy/sell signal
-        if raw_signal in ("buy", "sell") and self._pending_signal != raw_signal:
-            self._pending_signal = raw_signal
+        if direction and self._pending_dir != direction:
+            self._pending_dir = direction
             self._pending_entry_price = last_close
-            self._tick_results = []
+            self._tick_results.clear()
             self._waiting = True
             self._last_signal = signal
             if self.logger:
                 self.logger.info(
-                    f"[NTick] New pending signal: {raw_signal}, entry_price={last_close}, waiting for {self.n_ticks} ticks."
+                    "[NTick] New pending signal: %s, entry_price=%s, waiting for %s ticks.",
+                    raw_signal,
+                    last_close,
+                    self.n_ticks,
                 )
             return {
                 **signal,
@@ -154,9 +196,9 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
             }
 
         # 6. If no actionable signal, or after reset
-        if raw_signal not in ("buy", "sell"):
+        if not direction:
             if self.logger:
-                self.logger.info(f"[NTick] Raw signal not buy/sell, resetting.")
+                self.logger.info("[NTick] Raw signal not buy/sell, resetting.")
             self._reset()
         return {
             **signal,
@@ -171,9 +213,9 @@ class NTickConfirmedSignalStrategy(BaseSignalStrategy):
 
     def _reset(self):
         if self.logger:
-            self.logger.info(f"[NTick] Resetting internal state.")
-        self._pending_signal = None
+            self.logger.info("[NTick] Resetting internal state.")
+        self._pending_dir = 0
         self._pending_entry_price = None
-        self._tick_results = []
+        self._tick_results.clear()
         self._waiting = False
         self._last_signal = None
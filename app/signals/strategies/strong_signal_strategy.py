@@ -1,7 +1,16 @@
 from typing import Any, Callable, List, Optional, Dict
+from app.signals.indicators.prices import close_array
 from app.signals.strategies.base_signal_strategy import BaseSignalStrategy
 from app.utils.configure_logging import logger as default_logger
 
+# Indicator output -> vote; index by sign(net) (-1 wraps to "sell")
+_VOTES = {"buy": 1, "sell": -1}
+_SIGNAL_BY_SIGN = ("hold", "buy", "sell")
+
+
+def _copy_result(result: dict) -> dict:
+    return {**result, "indicators": dict(result["indicators"])}
+
 
 class StrongSignalStrategy(BaseSignalStrategy):
     """
@@ -9,6 +18,20 @@ class StrongSignalStrategy(BaseSignalStrategy):
     Accepts any set of indicator functions and combines their outputs.
     """
 
+    __slots__ = (
+        "indicators",
+        "logger",
+        "min_candles",
+        "confidence_threshold",
+        "config",
+        "_last_key",
+        "_last_result",
+        "_default_symbol",
+        "_array_indicators",
+        "_vote_divisor",
+        "_min_votes",
+    )
+
     def __init__(
         self,
         indicators: Dict[str, Callable[[List[dict]], Any]],
@@ -22,50 +45,115 @@ class StrongSignalStrategy(BaseSignalStrategy):
         self.min_candles = int(min_candles or 1)
         self.confidence_threshold = float(confidence_threshold)
         self.config = config
+        # Indicators that take the shared closes array instead of candle dicts
+        self._array_indicators = frozenset(
+            name
+            for name, fn in indicators.items()
+            if getattr(fn, "accepts_closes", False)
+        )
+
+        # Partial evaluation of the confidence gate: indicators and threshold are
+        # fixed after construction, so precompute the smallest vote count that
+        # clears it (same float comparison generate_signal used to do per call)
+        self._vote_divisor = max(1, len(indicators))
+        self._min_votes = next(
+            (
+                k
+                for k in range(len(indicators) + 1)
+                if k / self._vote_divisor >= self.confidence_threshold
+            ),
+            len(indicators) + 1,
+        )
+
+        # Fallback when candles carry no symbol; config.SYMBOLS does not change
+        self._default_symbol: Optional[str] = (
+            config.SYMBOLS[0] if getattr(config, "SYMBOLS", None) else None
+        )
+
+        # Last (key, result) pair; see generate_signal
+        self._last_key: Optional[tuple] = None
+        self._last_result: Optional[dict] = None
 
     def generate_signal(
         self, candles: List[dict], *, apply_entry_filters: bool = False
     ) -> dict:
-        print(f"candles received: {len(candles)}")
-        symbol = self._resolve_symbol(candles, getattr(self, "config", None))
-        print(f"Generating signal for {symbol} using StrongSignalStrategy")
-        if not candles or len(candles) < self.min_candles:
-            self.logger.error(
-                f"Not enough data to calculate indicators. Need at least {self.min_candles} data points."
+        # Hoist attribute reads: this runs on every orchestrator tick
+        log = self.logger
+        indicators = self.indicators
+        min_candles = self.min_candles
+        n = len(candles) if candles else 0
+
+        symbol = (candles[-1].get("symbol") if n else None) or self._default_symbol
+        log.debug("Generating signal for %s from %d candles", symbol, n)
+        if not n or n < min_candles:
+            log.error(
+                "Not enough data to calculate indicators. Need at least %s data points.",
+                min_candles,
             )
             return {"error": "Not enough data for calculations"}
 
+        # Same newest candle, window size and mode -> same indicator outputs.
+        # Per-tick callers hit this until the next bar closes. Candles without
+        # a time cannot tell two windows apart, so they are never memoized.
+        last_time = candles[-1].get("time")
+        key = (
+            (last_time, n, symbol, apply_entry_filters)
+            if last_time is not None
+            else None
+        )
+        if key is not None and key == self._last_key:
+            return _copy_result(self._last_result)
+
+        # Extract closes once for every array-capable indicator
+        array_names = self._array_indicators
+        closes = None
+        if array_names:
+            try:
+                closes = close_array(candles)
+            except Exception:
+                array_names = frozenset()  # let each indicator handle the raw candles
+
         results = {}
-        for name, fn in self.indicators.items():
+        for name, fn in indicators.items():
             try:
-                results[name] = fn(candles)
+                results[name] = fn(closes if name in array_names else candles)
             except Exception as e:
-                self.logger.error(f"{name} indicator failed: {e}")
+                log.error("%s indicator failed: %s", name, e)
                 results[name] = None
 
-        # Example logic: combine indicators (customize as needed)
-        # Here, we just check for 'buy'/'sell' in any indicator
-        buy_votes = sum(1 for v in results.values() if v == "buy")
-        sell_votes = sum(1 for v in results.values() if v == "sell")
-        total_votes = buy_votes + sell_votes
+        # Combine indicators: each 'buy'/'sell' is a +1/-1 vote; the sign of the
+        # net score picks the side, the share of non-hold votes is the confidence
+        net = 0
+        total_votes = 0
+        for v in results.values():
+            vote = _VOTES.get(v, 0)
+            net += vote
+            total_votes += vote & 1
 
-        confidence = total_votes / max(1, len(self.indicators))
-        raw_signal = "hold"
-        if buy_votes > sell_votes and confidence >= self.confidence_threshold:
-            raw_signal = "buy"
-        elif sell_votes > buy_votes and confidence >= self.confidence_threshold:
-            raw_signal = "sell"
+        confidence = total_votes / self._vote_divisor
+        raw_signal = (
+            _SIGNAL_BY_SIGN[(net > 0) - (net < 0)]
+            if total_votes >= self._min_votes
+            else "hold"
+        )
 
         # Optionally, add entry filters here if needed
 
-        self.logger.info(
-            f"Indicators: {results}, Raw signal: {raw_signal}, Confidence: {confidence:.2f}"
+        log.info(
+            "Indicators: %s, Raw signal: %s, Confidence: %.2f",
+            results,
+            raw_signal,
+            confidence,
         )
 
-        return {
+        result = {
             "final_signal": raw_signal,
             "raw_signal": raw_signal,
             "confidence": confidence,
             "indicators": results,
             "symbol": symbol,
         }
+        self._last_key = key
+        self._last_result = result
+        # Callers get their own copy so mutating it cannot corrupt the memo
+        return _copy_result(result)
@@ -1,8 +1,28 @@
-from logging import info
+import logging
+import time
 import MetaTrader5 as mt5
 
 from app.config.settings import Config
 
+logger = logging.getLogger(__name__)
+
+# Symbol metadata (digits, point, stops level, volume limits) is static over a
+# session; re-read it from the terminal at most this often
+_SYMBOL_INFO_TTL = 300.0
+
+# Default order of filling modes to try until the broker accepts one
+_FILLING_MODES = (
+    mt5.ORDER_FILLING_FOK,
+    mt5.ORDER_FILLING_RETURN,
+    mt5.ORDER_FILLING_IOC,
+)
+# symbol_info.filling_mode flag bit -> the order filling mode it advertises
+# (RETURN has no flag; it stays in the fallback order)
+_ADVERTISED_FILLING = (
+    (getattr(mt5, "SYMBOL_FILLING_FOK", 1), mt5.ORDER_FILLING_FOK),
+    (getattr(mt5, "SYMBOL_FILLING_IOC", 2), mt5.ORDER_FILLING_IOC),
+)
+
 
 def create_broker(mode):
     """Provider for DI wiring of Broker."""
@@ -13,19 +33,32 @@ class Broker:
     def __init__(self, mode: str):
         self.mode = mode
         self.open_positions_sim = []
+        # symbol -> (fetched_at monotonic, mt5 SymbolInfo)
+        self._symbol_info_cache: dict = {}
+        # symbol -> filling mode the broker last accepted
+        self._preferred_filling: dict[str, int] = {}
+        self.reload_config()
 
         # MT5 is required for live/backtest and also for demo if you want real ticks/info.
         if not mt5.initialize():
             raise RuntimeError("MT5 initialization failed")
 
-        info(f"Broker initialized in {self.mode} mode")
+        logger.info("Broker initialized in %s mode", self.mode)
+
+    def reload_config(self) -> None:
+        """Snapshot the Config values used per order (static at runtime)."""
+        self._deviation = int(getattr(Config, "MAX_DEVIATION", 5) or 5)
+        self._magic = int(getattr(Config, "MAGIC_NUMBER", 123456) or 123456)
+        self._min_sl_pips = float(getattr(Config, "MIN_SL_PIPS", 5.0) or 5.0)
 
     # -----------------------------
     # Public trading API
     # -----------------------------
 
     def place_buy(self, symbol, lot, sl, tp, price=None):
-        print(f"Broker.place_buy called: {symbol}, lot={lot}, sl={sl}, tp={tp}")
+        logger.debug(
+            "Broker.place_buy called: %s, lot=%s, sl=%s, tp=%s", symbol, lot, sl, tp
+        )
         if self.mode == "backtest":
             self._backtest_trade(symbol, "BUY", lot, sl, tp, price)
         elif self.mode == "demo":
@@ -34,7 +67,9 @@ class Broker:
             return self._mt5_place_order(symbol, "BUY", lot, sl, tp)  # live mode/
 
     def place_sell(self, symbol, lot, sl, tp, price=None):
-        print(f"Broker.place_sell called: {symbol}, lot={lot}, sl={sl}, tp={tp}")
+        logger.debug(
+            "Broker.place_sell called: %s, lot=%s, sl=%s, tp=%s", symbol, lot, sl, tp
+        )
         if self.mode == "backtest":
             self._backtest_trade(symbol, "SELL", lot, sl, tp, price)
         elif self.mode == "demo":
@@ -49,6 +84,16 @@ class Broker:
             return self.open_positions_sim
         return mt5.positions_get(symbol=symbol) if symbol else mt5.positions_get()
 
+    def get_position_by_ticket(self, ticket):
+        """Single open position by ticket, or None (MT5 filters server-side)."""
+        if self.mode in ("demo", "backtest"):
+            for p in self.open_positions_sim:
+                if p.get("ticket") == ticket:
+                    return p
+            return None
+        positions = mt5.positions_get(ticket=int(ticket))
+        return positions[0] if positions else None
+
     # -----------------------------
     # Simulation / backtest
     # -----------------------------
@@ -69,7 +114,7 @@ class Broker:
             "profit": 0.0,
         }
         self.open_positions_sim.append(trade)
-        print(f"Demo mode: {direction} {symbol} {lot} lots at {price}")
+        logger.info("Demo mode: %s %s %s lots at %s", direction, symbol, lot, price)
 
     def _backtest_trade(self, symbol, direction, lot, sl, tp, price):
         if price is None:
@@ -87,14 +132,29 @@ class Broker:
             "profit": 0.0,
         }
         self.open_positions_sim.append(trade)
-        print(f"Backtest mode: {direction} {symbol} {lot} lots at {price}")
+        logger.info("Backtest mode: %s %s %s lots at %s", direction, symbol, lot, price)
 
     # -----------------------------
     # Symbol helpers
     # -----------------------------
 
     def get_symbol_info(self, symbol):
-        return mt5.symbol_info(symbol)
+        """
+        mt5.symbol_info with a per-symbol TTL cache. One order otherwise asks
+        the terminal for the same metadata 5+ times (point, digits, stops
+        level, normalization). Misses are not cached so a symbol that was not
+        selected yet is retried.
+        """
+        now = time.monotonic()
+        hit = self._symbol_info_cache.get(symbol)
+        if hit is not None and now - hit[0] < _SYMBOL_INFO_TTL:
+            return hit[1]
+        si = mt5.symbol_info(symbol)
+        if si is None:
+            self._symbol_info_cache.pop(symbol, None)
+        else:
+            self._symbol_info_cache[symbol] = (now, si)
+        return si
 
     def get_point_size(self, symbol: str) -> float:
         """Returns MT5 'point' (minimum price increment)."""
@@ -130,6 +190,23 @@ class Broker:
             return 2.0 * self.get_point_size(symbol)
         return float(si.trade_stops_level) * float(si.point)
 
+    def get_filling_modes(self, symbol: str) -> tuple:
+        """
+        Filling modes to try for `symbol`: the one last accepted first, else
+        the ones the symbol advertises, then the remaining defaults.
+        """
+        preferred = self._preferred_filling.get(symbol)
+        if preferred is not None:
+            first = [preferred]
+        else:
+            si = self.get_symbol_info(symbol)
+            flags = int(getattr(si, "filling_mode", 0) or 0) if si is not None else 0
+            first = [mode for bit, mode in _ADVERTISED_FILLING if flags & bit]
+        return tuple(first + [m for m in _FILLING_MODES if m not in first])
+
+    def remember_filling_mode(self, symbol: str, mode: int) -> None:
+        self._preferred_filling[symbol] = mode
+
     # Backward-compatible name (CONSISTENT: returns point size only)
     def _get_symbol_point(self, symbol):
         return self.get_point_size(symbol)
@@ -152,7 +229,7 @@ class Broker:
     def _mt5_place_order(self, symbol, direction, lot, sl, tp):
         si = self.get_symbol_info(symbol)
         if si is None:
-            print(f"Symbol {symbol} not found")
+            logger.error("Symbol %s not found", symbol)
             return None
 
         # Normalize volume to broker constraints
@@ -164,7 +241,7 @@ class Broker:
 
         tick = mt5.symbol_info_tick(symbol)
         if tick is None:
-            print(f"Failed to get tick for {symbol}")
+            logger.error("Failed to get tick for %s", symbol)
             return None
 
         # Use live tick price
@@ -179,50 +256,51 @@ class Broker:
 
         # Enforce minimum distance (price units) against live tick
         if sl is not None and abs(price - sl) < min_dist:
-            print(f"SL too close for {symbol}, adjusting")
+            logger.info("SL too close for %s, adjusting", symbol)
             sl = price - min_dist if direction == "BUY" else price + min_dist
             sl = self._normalize_price(symbol, sl)
 
         if tp is not None and abs(price - tp) < min_dist:
-            print(f"TP too close for {symbol}, adjusting")
+            logger.info("TP too close for %s, adjusting", symbol)
             tp = price + min_dist if direction == "BUY" else price - min_dist
             tp = self._normalize_price(symbol, tp)
 
         order_type = mt5.ORDER_TYPE_BUY if direction == "BUY" else mt5.ORDER_TYPE_SELL
 
-        for filling_mode in (
-            mt5.ORDER_FILLING_FOK,
-            mt5.ORDER_FILLING_RETURN,
-            mt5.ORDER_FILLING_IOC,
-        ):
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": symbol,
-                "volume": lot,
-                "type": order_type,
-                "price": price,
-                "deviation": 5,
-                "magic": 123456,
-                "comment": "Placed by Python",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": filling_mode,
-            }
-            if sl is not None:
-                request["sl"] = sl
-            if tp is not None:
-                request["tp"] = tp
+        # Built once; only type_filling changes between attempts
+        request = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "volume": lot,
+            "type": order_type,
+            "price": price,
+            "deviation": self._deviation,
+            "magic": self._magic,
+            "comment": "Placed by Python",
+            "type_time": mt5.ORDER_TIME_GTC,
+        }
+        if sl is not None:
+            request["sl"] = sl
+        if tp is not None:
+            request["tp"] = tp
 
+        for filling_mode in self.get_filling_modes(symbol):
+            request["type_filling"] = filling_mode
             result = mt5.order_send(request)
-            print(
-                f"MT5 order result for {symbol} with filling_mode {filling_mode}: {result}"
+            logger.info(
+                "MT5 order result for %s with filling_mode %s: %s",
+                symbol,
+                filling_mode,
+                result,
             )
 
             if result.retcode in (mt5.TRADE_RETCODE_DONE, mt5.TRADE_RETCODE_PLACED):
+                self.remember_filling_mode(symbol, filling_mode)
                 return result
             if result.comment != "Unsupported filling mode":
                 return result
 
-        print(f"All filling modes failed for {symbol}")
+        logger.error("All filling modes failed for %s", symbol)
         return None
 
     # -----------------------------
@@ -256,8 +334,7 @@ class Broker:
 
         # Safety clamp so upstream "min SL pips" actually applies to real orders
         if units == "pips":
-            min_sl = float(getattr(Config, "MIN_SL_PIPS", 5.0) or 5.0)
-            sl_pips = max(float(sl_pips), min_sl)
+            sl_pips = max(float(sl_pips), self._min_sl_pips)
             tp_pips = max(0.0, float(tp_pips))
 
         step = (
@@ -284,8 +361,12 @@ class Broker:
         """
         Closes a position by ticket (preferred), or by symbol/side if ticket is not provided.
         """
-        print(
-            f"Broker.close_position called: ticket={ticket}, symbol={symbol}, side={side}, volume={volume}"
+        logger.debug(
+            "Broker.close_position called: ticket=%s, symbol=%s, side=%s, volume=%s",
+            ticket,
+            symbol,
+            side,
+            volume,
         )
 
         if self.mode in ("demo", "backtest"):
@@ -300,20 +381,17 @@ class Broker:
                     p for p in self.open_positions_sim if p.get("symbol") != symbol
                 ]
             after = len(self.open_positions_sim)
-            print(f"Simulated close: {before - after} positions closed.")
+            logger.info("Simulated close: %d positions closed.", before - after)
             return True
 
         # Live mode: use MT5
         if ticket is None:
-            print("No ticket provided for close_position; cannot close.")
+            logger.warning("No ticket provided for close_position; cannot close.")
             return False
 
-        position = None
-        positions = mt5.positions_get(ticket=ticket)
-        if positions and len(positions) > 0:
-            position = positions[0]
+        position = self.get_position_by_ticket(ticket)
         if not position:
-            print(f"No open position found for ticket {ticket}")
+            logger.warning("No open position found for ticket %s", ticket)
             return False
 
         symbol = symbol or position.symbol
@@ -332,20 +410,23 @@ class Broker:
             "type": mt5.ORDER_TYPE_SELL if side == "BUY" else mt5.ORDER_TYPE_BUY,
             "position": ticket,
             "price": price,
-            "deviation": 5,
-            "magic": 123456,
+            "deviation": self._deviation,
+            "magic": self._magic,
             "comment": "Closed by Python",
             "type_time": mt5.ORDER_TIME_GTC,
             "type_filling": mt5.ORDER_FILLING_IOC,
         }
 
         result = mt5.order_send(request)
-        print(f"MT5 close result for ticket {ticket}: {result}")
+        logger.info("MT5 close result for ticket %s: %s", ticket, result)
         if result.retcode in (mt5.TRADE_RETCODE_DONE, mt5.TRADE_RETCODE_PLACED):
-            print(f"Position {ticket} closed successfully.")
+            logger.info("Position %s closed successfully.", ticket)
             return True
         else:
-            print(
-                f"Failed to close position {ticket}: {result.retcode} {getattr(result, 'comment', '')}"
+            logger.error(
+                "Failed to close position %s: %s %s",
+                ticket,
+                result.retcode,
+                getattr(result, "comment", ""),
             )
             return False
@@ -38,7 +38,6 @@ class EnterTrade:
         lot = self.risk_manager.calculate_lot_size(
             account_balance,
             sl_pips,
-            symbol_price=price,
             symbol=symbol,
             risk_percent=Config.LOT_RISK_PERCENT,
         )
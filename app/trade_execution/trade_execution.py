@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
+import logging
 import re
+import time
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import MetaTrader5 as mt5
+
 from app.config.settings import Config
 
+logger = logging.getLogger(__name__)
+
+# Filling modes tried in order until the broker accepts one
+_FILLING_MODES = (
+    mt5.ORDER_FILLING_FOK,
+    mt5.ORDER_FILLING_RETURN,
+    mt5.ORDER_FILLING_IOC,
+)
+_SENT_RETCODES = (mt5.TRADE_RETCODE_DONE, mt5.TRADE_RETCODE_PLACED)
+
+# Exit debounce entries kept; older tickets are long closed
+_MAX_EXIT_ATTEMPTS_TRACKED = 4096
+
+# Characters MT5 order comments may not contain (keep a conservative set)
+_MT5_COMMENT_RE = re.compile(r"[^A-Za-z0-9 _:\-\.]")
+
 
 def create_trade_executor(
     risk_manager: Any, broker: Any, market_data: Any
@@ -15,13 +36,51 @@ def create_trade_executor(
 
 
 class TradeExecutor:
+    __slots__ = (
+        "risk_manager",
+        "broker",
+        "market_data",
+        "daily_profit",
+        "last_reset",
+        "_last_exit_attempt_at",
+        "_deviation",
+        "_magic",
+        "_default_sl_pips",
+        "_default_tp_pips",
+        "_fallback_lot",
+    )
+
     def __init__(self, risk_manager: Any, broker: Any, market_data: Any):
         self.risk_manager = risk_manager
         self.broker = broker
         self.market_data = market_data
         self.daily_profit = 0
         self.last_reset = datetime.now()
-        self._last_exit_attempt_at: Dict[Any, datetime] = {}
+        # ticket -> last exit attempt, oldest first; bounded, see execute_exit
+        self._last_exit_attempt_at: OrderedDict[Any, float] = OrderedDict()
+
+        self.reload_config()
+
+    def reload_config(self) -> None:
+        """
+        Snapshot the Config values used per order. Config is static at
+        runtime; call this again only after changing it.
+        """
+        self._deviation = int(getattr(Config, "MAX_DEVIATION", 5) or 5)
+        self._magic = int(getattr(Config, "MAGIC_NUMBER", 123456) or 123456)
+        self._default_sl_pips = getattr(Config, "DEFAULT_SL_PIPS", 5.0)
+        self._default_tp_pips = getattr(Config, "DEFAULT_TP_PIPS", 50.0)
+
+        # Lot fallback: first usable of LOT_SIZE / DEFAULT_LOT / MIN_LOT, else 1
+        self._fallback_lot = 1
+        for k in ("LOT_SIZE", "DEFAULT_LOT", "MIN_LOT"):
+            v = getattr(Config, k, None)
+            if v is not None:
+                try:
+                    self._fallback_lot = float(v)
+                    break
+                except Exception:
+                    pass
 
     # -------------------------
     # Entry execution
@@ -46,18 +105,26 @@ class TradeExecutor:
         self, signals: Iterable[Dict[str, Any]], candles: Any = None
     ) -> None:
         _ = candles  # reserved for future sizing/sl/tp based on context
-        print(f"TradeExecutor.execute_signals called at {datetime.now()}")
+        # The log record carries its own timestamp; no per-call datetime formatting
+        logger.debug("TradeExecutor.execute_signals called")
 
         any_actionable = False
 
+        # Loop invariants
+        default_sl = self._default_sl_pips
+        default_tp = self._default_tp_pips
+        calc = getattr(self.broker, "calculate_sl_tp_prices", None)
+        if not callable(calc):
+            calc = None
+
         for s in signals or []:
             if not isinstance(s, dict):
-                print(f"Skipping malformed signal (not a dict): {s!r}")
+                logger.warning("Skipping malformed signal (not a dict): %r", s)
                 continue
 
             symbol = s.get("symbol")
             if not symbol:
-                print(f"Skipping malformed signal (missing symbol): {s!r}")
+                logger.warning("Skipping malformed signal (missing symbol): %r", s)
                 continue
 
             direction = self._extract_direction(s)
@@ -66,16 +133,15 @@ class TradeExecutor:
 
             lot = self._extract_lot(symbol=str(symbol), signal=s)
             if lot is None:
-                print(f"Skipping signal (could not determine lot): {s!r}")
+                logger.warning("Skipping signal (could not determine lot): %r", s)
                 continue
 
             # Always calculate SL/TP here using config defaults if not present
             price = s.get("open_price") or s.get("price")
-            sl_pips = s.get("sl_pips") or getattr(Config, "DEFAULT_SL_PIPS", 5.0)
-            tp_pips = s.get("tp_pips") or getattr(Config, "DEFAULT_TP_PIPS", 50.0)
+            sl_pips = s.get("sl_pips") or default_sl
+            tp_pips = s.get("tp_pips") or default_tp
 
-            calc = getattr(self.broker, "calculate_sl_tp_prices", None)
-            if callable(calc) and price is not None:
+            if calc is not None and price is not None:
                 sl, tp = calc(
                     direction,
                     price,
@@ -89,7 +155,14 @@ class TradeExecutor:
                 tp = None
 
             any_actionable = True
-            print(f"Executing trade: {symbol} {direction} lot={lot} sl={sl} tp={tp}")
+            logger.info(
+                "Executing trade: %s %s lot=%s sl=%s tp=%s",
+                symbol,
+                direction,
+                lot,
+                sl,
+                tp,
+            )
 
             if direction == "BUY":
                 self.broker.place_buy(str(symbol), float(lot), sl, tp)
@@ -97,7 +170,7 @@ class TradeExecutor:
                 self.broker.place_sell(str(symbol), float(lot), sl, tp)
 
         if not any_actionable:
-            print("No actionable signals (buy/sell), no trades executed.")
+            logger.debug("No actionable signals (buy/sell), no trades executed.")
 
     def _extract_direction(self, s: Dict[str, Any]) -> Optional[str]:
         """
@@ -127,7 +200,9 @@ class TradeExecutor:
         if side == "sell":
             return "SELL"
 
-        print(f"Skipping malformed signal (unknown direction/side={side!r}): {s!r}")
+        logger.warning(
+            "Skipping malformed signal (unknown direction/side=%r): %r", side, s
+        )
         return None
 
     def _extract_lot(self, *, symbol: str, signal: Dict[str, Any]) -> Optional[float]:
@@ -167,27 +242,19 @@ class TradeExecutor:
                 except Exception:
                     pass
 
-        # Config fallback
-        for k in ("LOT_SIZE", "DEFAULT_LOT", "MIN_LOT"):
-            v = getattr(Config, k, None)
-            if v is not None:
-                try:
-                    return float(v)
-                except Exception:
-                    pass
-
-        return 1
+        # Config fallback (snapshotted in reload_config)
+        return self._fallback_lot
 
     # -------------------------
     # Exit execution (used by hybrid ExitTrade)
     # -------------------------
 
-    def execute_exit(self, action: Any):
+    def execute_exit(self, action: Any, position: Any = None):
         """
         Executes an exit action by closing the position via the broker.
+        `position` may be passed by callers that already fetched it, which
+        skips the per-ticket lookup.
         """
-        import MetaTrader5 as mt5
-
         ticket = getattr(action, "ticket", None)
         volume = float(getattr(action, "volume", 0.0) or 0.0)
         symbol = getattr(action, "symbol", None)
@@ -196,36 +263,29 @@ class TradeExecutor:
             return None
 
         # Debounce: do not spam order_send every tick for the same ticket
-        now = datetime.now()
+        # Monotonic: immune to wall-clock jumps, and a plain float subtraction
+        now = time.monotonic()
         last_try = self._last_exit_attempt_at.get(ticket)
-        if last_try and (now - last_try).total_seconds() < 2.0:
-            return None
-        self._last_exit_attempt_at[ticket] = now
-
-        positions = self.broker.get_open_positions(symbol)
-        if not positions:
-            print(
-                f"Position with ticket {ticket} not found for exit (no open positions)."
-            )
+        if last_try is not None and now - last_try < 2.0:
             return None
-
-        position = None
-        for pos in positions:
-            pos_ticket = getattr(pos, "ticket", None) or (
-                pos.get("ticket") if isinstance(pos, dict) else None
-            )
-            if pos_ticket == ticket:
-                position = pos
-                break
-
+        attempts = self._last_exit_attempt_at
+        attempts[ticket] = now
+        attempts.move_to_end(ticket)
+        while len(attempts) > _MAX_EXIT_ATTEMPTS_TRACKED:
+            attempts.popitem(last=False)
+
+        if position is None:
+            position = self._find_position(ticket, symbol)
         if not position:
-            print(f"Position with ticket {ticket} not found for exit.")
+            logger.warning("Position with ticket %s not found for exit.", ticket)
             return None
 
         # MT5: position.type -> 0=BUY, 1=SELL
         pos_type = getattr(position, "type", None)
         if pos_type is None:
-            print(f"Cannot determine position type for ticket {ticket}; aborting exit.")
+            logger.warning(
+                "Cannot determine position type for ticket %s; aborting exit.", ticket
+            )
             return None
 
         close_is_sell = int(pos_type) == 0  # close BUY with SELL
@@ -233,8 +293,11 @@ class TradeExecutor:
 
         tick = mt5.symbol_info_tick(symbol)
         if tick is None:
-            print(
-                f"Failed to get tick for {symbol} while exiting ticket {ticket}. MT5 error: {mt5.last_error()}"
+            logger.error(
+                "Failed to get tick for %s while exiting ticket %s. MT5 error: %s",
+                symbol,
+                ticket,
+                mt5.last_error(),
             )
             return None
 
@@ -244,39 +307,51 @@ class TradeExecutor:
         except Exception:
             price = float(price)
 
-        filling_modes = (
-            mt5.ORDER_FILLING_FOK,
-            mt5.ORDER_FILLING_RETURN,
-            mt5.ORDER_FILLING_IOC,
-        )
+        order_send = mt5.order_send
+
+        # Built once; only type_filling changes between attempts
+        request = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "volume": volume,
+            "type": order_type,
+            "position": ticket,
+            "price": price,
+            "deviation": self._deviation,
+            "magic": self._magic,
+            # "comment": "...",  # OMIT: some brokers/terminals reject comments
+            "type_time": mt5.ORDER_TIME_GTC,
+        }
+
+        # Broker orders modes by what the symbol last accepted / advertises
+        get_modes = getattr(self.broker, "get_filling_modes", None)
+        filling_modes = get_modes(symbol) if callable(get_modes) else _FILLING_MODES
 
         for filling in filling_modes:
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": symbol,
-                "volume": volume,
-                "type": order_type,
-                "position": ticket,
-                "price": price,
-                "deviation": int(getattr(Config, "MAX_DEVIATION", 5) or 5),
-                "magic": int(getattr(Config, "MAGIC_NUMBER", 123456) or 123456),
-                # "comment": "...",  # OMIT: some brokers/terminals reject comments
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": filling,
-            }
-
-            result = mt5.order_send(request)
+            request["type_filling"] = filling
+            result = order_send(request)
             if result is None:
-                print(
-                    f"Exit order_send returned None for {symbol} ticket {ticket} filling={filling}. MT5 error: {mt5.last_error()}"
+                logger.error(
+                    "Exit order_send returned None for %s ticket %s filling=%s. MT5 error: %s",
+                    symbol,
+                    ticket,
+                    filling,
+                    mt5.last_error(),
                 )
                 continue
 
-            print(
-                f"Exit order result for {symbol} ticket {ticket} filling={filling}: {result}"
+            logger.info(
+                "Exit order result for %s ticket %s filling=%s: %s",
+                symbol,
+                ticket,
+                filling,
+                result,
             )
 
-            if result.retcode in (mt5.TRADE_RETCODE_DONE, mt5.TRADE_RETCODE_PLACED):
+            if result.retcode in _SENT_RETCODES:
+                remember = getattr(self.broker, "remember_filling_mode", None)
+                if callable(remember):
+                    remember(symbol, filling)
                 return result
 
             if getattr(result, "comment", "") != "Unsupported filling mode":
@@ -284,13 +359,40 @@ class TradeExecutor:
 
         return None
 
+    def _find_position(self, ticket: Any, symbol: str) -> Any:
+        # Direct ticket lookup; scan the symbol's positions only for broker
+        # adapters without one
+        getter = getattr(self.broker, "get_position_by_ticket", None)
+        if callable(getter):
+            try:
+                return getter(ticket)
+            except NotImplementedError:
+                pass
+            except Exception:
+                logger.exception("Position lookup failed for ticket %s", ticket)
+                return None
+
+        positions = self.broker.get_open_positions(symbol)
+        if not positions:
+            logger.warning(
+                "Position with ticket %s not found for exit (no open positions).",
+                ticket,
+            )
+            return None
+        for pos in positions:
+            pos_ticket = getattr(pos, "ticket", None) or (
+                pos.get("ticket") if isinstance(pos, dict) else None
+            )
+            if pos_ticket == ticket:
+                return pos
+        return None
+
     def _safe_mt5_comment(self, text: str, *, max_len: int = 31) -> str:
         """
         MT5/brokers often require comment <= 31 chars and ASCII-ish.
         """
-        s = str(text or "")
-        s = s.encode("ascii", "ignore").decode("ascii")  # drop non-ascii
-        s = re.sub(r"[^A-Za-z0-9 _:\-\.]", "", s)  # keep a conservative set
+        # The whitelist is pure ASCII, so it also drops non-ASCII characters
+        s = _MT5_COMMENT_RE.sub("", str(text or ""))
         s = s.strip()
         if not s:
             s = "EXIT"
@@ -1,4 +1,6 @@
 import logging
+import logging.handlers
+import queue
 
 
 def configure_logging():
@@ -16,5 +18,44 @@ def configure_logging():
     return logger
 
 
+def start_queue_logging() -> logging.handlers.QueueListener | None:
+    """
+    Put a QueueHandler in front of the root handlers and write through a
+    listener thread. The message is still formatted on the calling thread
+    (QueueHandler.prepare); only the handlers' stream/file I/O moves off it.
+
+    Call once at app startup and pass the result to stop_queue_logging at
+    shutdown. Returns None when there is nothing to move.
+    """
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    if not handlers or any(
+        isinstance(h, logging.handlers.QueueHandler) for h in handlers
+    ):
+        return None
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    for h in handlers:
+        root.removeHandler(h)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: logging.handlers.QueueListener | None) -> None:
+    """Flush the queue and hand the original handlers back to the root logger."""
+    if listener is None:
+        return
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        if isinstance(h, logging.handlers.QueueHandler):
+            root.removeHandler(h)
+    listener.stop()
+    for h in listener.handlers:
+        root.addHandler(h)
+
+
 # Initialize the logger
 logger = configure_logging()
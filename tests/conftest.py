@@ -0,0 +1,41 @@
+import sys
+import types
+
+try:
+    import MetaTrader5  # noqa: F401
+except ImportError:
+    # The terminal package is Windows-only; tests patch the calls they need
+    mt5 = types.ModuleType("MetaTrader5")
+    mt5.__dict__.update(
+        TIMEFRAME_M1=1,
+        TIMEFRAME_M5=5,
+        TIMEFRAME_M15=15,
+        TIMEFRAME_M30=30,
+        TIMEFRAME_H1=16385,
+        TIMEFRAME_D1=16408,
+        ORDER_FILLING_FOK=0,
+        ORDER_FILLING_IOC=1,
+        ORDER_FILLING_RETURN=2,
+        ORDER_TYPE_BUY=0,
+        ORDER_TYPE_SELL=1,
+        ORDER_TIME_GTC=0,
+        POSITION_TYPE_BUY=0,
+        TRADE_ACTION_DEAL=1,
+        TRADE_RETCODE_PLACED=10008,
+        TRADE_RETCODE_DONE=10009,
+    )
+    for name in (
+        "initialize",
+        "shutdown",
+        "last_error",
+        "account_info",
+        "symbol_info",
+        "symbol_info_tick",
+        "symbol_select",
+        "symbols_get",
+        "copy_rates_from_pos",
+        "positions_get",
+        "order_send",
+    ):
+        setattr(mt5, name, lambda *args, **kwargs: None)
+    sys.modules["MetaTrader5"] = mt5
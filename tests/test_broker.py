@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.trade_execution import broker as broker_mod
+from app.trade_execution.broker import Broker
+
+mt5 = broker_mod.mt5
+FOK, IOC, RETURN = (
+    mt5.ORDER_FILLING_FOK,
+    mt5.ORDER_FILLING_IOC,
+    mt5.ORDER_FILLING_RETURN,
+)
+
+
+def _symbol_info(filling_mode=0):
+    return SimpleNamespace(
+        point=0.00001,
+        digits=5,
+        trade_stops_level=0,
+        volume_min=0.01,
+        volume_max=50.0,
+        volume_step=0.01,
+        trade_contract_size=100_000.0,
+        filling_mode=filling_mode,
+    )
+
+
+@pytest.fixture
+def make_broker(monkeypatch):
+    def make(info):
+        calls = []
+
+        def symbol_info(symbol):
+            calls.append(symbol)
+            return info
+
+        monkeypatch.setattr(mt5, "initialize", lambda *a, **k: True)
+        monkeypatch.setattr(mt5, "symbol_info", symbol_info)
+        br = Broker("live")
+        return br, calls
+
+    return make
+
+
+def test_filling_modes_default_order(make_broker):
+    br, _ = make_broker(_symbol_info())
+    assert br.get_filling_modes("EURUSD") == (FOK, RETURN, IOC)
+
+
+def test_advertised_filling_mode_goes_first(make_broker):
+    br, _ = make_broker(_symbol_info(filling_mode=2))  # SYMBOL_FILLING_IOC
+    assert br.get_filling_modes("EURUSD") == (IOC, FOK, RETURN)
+
+
+def test_remembered_filling_mode_skips_symbol_info(make_broker):
+    br, calls = make_broker(_symbol_info(filling_mode=2))
+    br.remember_filling_mode("EURUSD", RETURN)
+    calls.clear()
+    assert br.get_filling_modes("EURUSD") == (RETURN, FOK, IOC)
+    assert calls == []
+
+
+def test_order_send_learns_the_accepted_filling_mode(make_broker, monkeypatch):
+    br, _ = make_broker(_symbol_info())
+    sent = []
+
+    def order_send(request):
+        sent.append(request["type_filling"])
+        if request["type_filling"] == RETURN:
+            return SimpleNamespace(retcode=mt5.TRADE_RETCODE_DONE, comment="Done")
+        return SimpleNamespace(retcode=10030, comment="Unsupported filling mode")
+
+    monkeypatch.setattr(mt5, "order_send", order_send)
+    monkeypatch.setattr(
+        mt5, "symbol_info_tick", lambda s: SimpleNamespace(ask=1.10002, bid=1.1)
+    )
+
+    assert br.place_buy("EURUSD", 0.1, None, None).retcode == mt5.TRADE_RETCODE_DONE
+    assert sent == [FOK, RETURN]
+
+    sent.clear()
+    br.place_sell("EURUSD", 0.1, None, None)
+    assert sent == [RETURN]
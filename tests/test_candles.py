@@ -0,0 +1,119 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.data import candles as candles_mod
+from app.data.candles import LiveCandleCollector, MultiTimeframeCandleCollector
+
+M1 = 1
+
+
+def _freeze_clocks(monkeypatch, *, wall, server):
+    monkeypatch.setattr(candles_mod.time, "time", lambda: float(wall))
+    monkeypatch.setattr(
+        candles_mod.mt5, "symbol_info_tick", lambda symbol: SimpleNamespace(time=server)
+    )
+
+
+def test_live_collector_waits_for_the_server_bar_deadline(monkeypatch):
+    wall = 1_700_000_000
+    server = wall + 3 * 3600 + 17  # broker clock three hours and 17s ahead
+    _freeze_clocks(monkeypatch, wall=wall, server=server)
+    collector = LiveCandleCollector(symbol="EURUSD", timeframe=M1, count=10)
+
+    # Newest closed bar opened 95s ago on the server, so it closed 35s ago
+    # and the next one closes in 25s (+1s slack)
+    bar_time = datetime.fromtimestamp(server - 95)
+    assert collector._seconds_to_next_close(bar_time) == 26
+
+
+def test_live_collector_falls_back_to_the_server_boundary(monkeypatch):
+    wall = 1_700_000_000
+    server = wall + 42
+    _freeze_clocks(monkeypatch, wall=wall, server=server)
+    collector = LiveCandleCollector(symbol="EURUSD", timeframe=M1, count=10)
+
+    assert collector._seconds_to_next_close(None) == 60 - (server % 60) + 1
+
+
+class _FakeMarketData:
+    def __init__(self, bars):
+        self.bars = bars  # full history, oldest first, newest closed bar last
+        self.requests = []
+
+    def get_historical_candles(self, symbol, timeframe, start_pos, count, verbose):
+        self.requests.append(count)
+        return [dict(b) for b in self.bars[-count:]]
+
+
+def _bars(n, *, start=0, step=60):
+    return [{"time": start + i * step, "close": 1.0 + i} for i in range(n)]
+
+
+def _mtf_collector(bars, count=5):
+    collector = MultiTimeframeCandleCollector(
+        symbol="EURUSD", timeframes=[M1], count=count
+    )
+    collector.market_data = _FakeMarketData(bars)
+    return collector
+
+
+def test_sync_fetches_the_full_window_until_one_is_held():
+    collector = _mtf_collector(_bars(10))
+    collector._latest_by_tf[M1] = _bars(3)
+
+    candles = collector._sync_tf_candles(M1)
+
+    assert collector.market_data.requests == [5]
+    assert [c["time"] for c in candles] == [c["time"] for c in _bars(10)[-5:]]
+    assert all(c["symbol"] == "EURUSD" for c in candles)
+
+
+def test_sync_appends_only_new_bars_when_the_delta_overlaps():
+    history = _bars(10)
+    collector = _mtf_collector(history)
+    held = [dict(b, symbol="EURUSD") for b in history[-6:-1]]
+    collector._latest_by_tf[M1] = held
+
+    candles = collector._sync_tf_candles(M1)
+
+    assert collector.market_data.requests == [candles_mod._DELTA_BARS]
+    assert [c["time"] for c in candles] == [b["time"] for b in history[-5:]]
+    assert candles[-1]["symbol"] == "EURUSD"
+
+
+def test_sync_returns_the_held_window_when_nothing_is_new():
+    history = _bars(10)
+    collector = _mtf_collector(history)
+    held = [dict(b, symbol="EURUSD") for b in history[-5:]]
+    collector._latest_by_tf[M1] = held
+
+    assert collector._sync_tf_candles(M1) is held
+
+
+def test_sync_refetches_the_window_after_a_gap_wider_than_the_delta():
+    history = _bars(20)
+    collector = _mtf_collector(history)
+    # Held window ends 10 bars before the newest one: no overlap with the delta
+    collector._latest_by_tf[M1] = [dict(b, symbol="EURUSD") for b in history[5:10]]
+
+    candles = collector._sync_tf_candles(M1)
+
+    assert collector.market_data.requests == [candles_mod._DELTA_BARS, 5]
+    assert [c["time"] for c in candles] == [b["time"] for b in history[-5:]]
+
+
+def test_stamp_is_closed_matches_a_per_candle_check():
+    collector = _mtf_collector([])
+    for now in range(0, 8 * 60, 7):
+        candles = _bars(6)
+        collector._stamp_is_closed(candles, M1, now)
+        assert [c["is_closed"] for c in candles] == [
+            c["time"] + 60 <= now for c in candles
+        ]
+
+
+def test_stamp_is_closed_treats_unknown_times_as_closed():
+    collector = _mtf_collector([])
+    candles = [{"time": 0}, {"time": None}, {"time": 600}]
+    collector._stamp_is_closed(candles, M1, 300)
+    assert [c["is_closed"] for c in candles] == [True, True, False]
@@ -0,0 +1,34 @@
+import logging
+import threading
+
+from app.utils.configure_logging import start_queue_logging, stop_queue_logging
+
+
+class _ThreadRecorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(threading.current_thread().name)
+
+
+def test_queue_logging_writes_on_the_listener_thread_and_restores_handlers():
+    root = logging.getLogger()
+    saved = list(root.handlers)
+    recorder = _ThreadRecorder()
+    root.handlers[:] = [recorder]
+    try:
+        listener = start_queue_logging()
+        assert listener is not None
+        assert recorder not in root.handlers
+
+        logging.getLogger("tests").warning("hello %s", "queue")
+        stop_queue_logging(listener)
+
+        assert root.handlers == [recorder]
+        assert recorder.threads and threading.current_thread().name not in (
+            recorder.threads
+        )
+    finally:
+        root.handlers[:] = saved
@@ -0,0 +1,47 @@
+import numpy as np
+
+from app.signals._kernels import pullback_completed_kernel, wilder_rsi_kernel
+
+
+def _reference_rsi(closes, period):
+    # The array implementation calculate_rsi used before the kernel
+    delta = np.diff(closes)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    for i in range(1, len(gains)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    rs = avg_gain / (avg_loss + 1e-8)
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def test_wilder_rsi_kernel_matches_reference():
+    rng = np.random.default_rng(7)
+    closes = 1.1 + np.cumsum(rng.normal(0, 0.001, 60))
+    for period in (3, 7, 14):
+        assert np.isclose(
+            float(wilder_rsi_kernel(closes, period)), _reference_rsi(closes, period)
+        )
+
+
+def _reference_pullback(closes):
+    # The list implementation MultiTimeframeStrongSignalStrategy used before
+    if len(closes) < 21:
+        return False
+    sma20 = sum(closes[-20:]) / 20
+    was_below = any(c < sma20 for c in closes[-25:-20])
+    return was_below and closes[-1] > sma20
+
+
+def test_pullback_completed_kernel_matches_reference():
+    rng = np.random.default_rng(11)
+    hits = 0
+    for n in (5, 20, 21, 22, 25, 40):
+        for _ in range(50):
+            closes = 1.1 + np.cumsum(rng.normal(0, 0.001, n))
+            expected = _reference_pullback(closes.tolist())
+            assert bool(pullback_completed_kernel(closes)) is expected
+            hits += expected
+    assert hits
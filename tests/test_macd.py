@@ -0,0 +1,46 @@
+import numpy as np
+
+from app.signals.indicators.macd import StreamingMACD, calculate_macd
+
+WINDOW = 120
+
+
+def _candles(closes, *, symbol="EURUSD", start=0, step=60):
+    return [
+        {"symbol": symbol, "time": start + i * step, "close": float(c)}
+        for i, c in enumerate(closes)
+    ]
+
+
+def _walk(n, seed):
+    rng = np.random.default_rng(seed)
+    return 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+
+
+def _assert_matches(streaming, candles):
+    for end in range(WINDOW, len(candles) + 1):
+        window = candles[end - WINDOW : end]
+        assert streaming(window) == calculate_macd(window), end
+
+
+def test_streaming_matches_full_recompute_over_sliding_windows():
+    streaming = StreamingMACD()
+    candles = _candles(_walk(520, seed=3))
+    _assert_matches(streaming, candles)
+
+
+def test_new_symbol_and_time_gap_force_a_full_recompute():
+    streaming = StreamingMACD()
+    eurusd = _candles(_walk(300, seed=5))
+    _assert_matches(streaming, eurusd)
+
+    # Interleaving a second symbol keeps a separate stream
+    gbpusd = _candles(_walk(300, seed=9), symbol="GBPUSD")
+    _assert_matches(streaming, gbpusd)
+    assert ("GBPUSD", 60) in streaming._state
+
+    # Weekend-style gap: the next window no longer follows the stored bar
+    gap_start = eurusd[-1]["time"] + 3 * 86400
+    after_gap = eurusd + _candles(_walk(200, seed=7), start=gap_start)
+    _assert_matches(streaming, after_gap[len(eurusd) - WINDOW + 1 :])
+    assert streaming._state[("EURUSD", 60)][0] == after_gap[-1]["time"]
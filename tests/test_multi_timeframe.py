@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+
+from app.signals.strategies.multi_timeframe import MultiTimeframeStrongSignalStrategy
+from app.signals.strategies.strong_signal_strategy import StrongSignalStrategy
+
+M1, M5, M15 = 1, 5, 15
+
+
+class _CountingIndicator:
+    """Votes 'buy' on a rising last bar, 'sell' on a falling one; counts calls per window length."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, candles):
+        self.calls.append(len(candles))
+        return "buy" if candles[-1]["close"] > candles[-2]["close"] else "sell"
+
+
+def _strategy(indicator):
+    base = StrongSignalStrategy(
+        {"trend": indicator},
+        min_candles=2,
+        config=SimpleNamespace(SYMBOLS=["EURUSD"]),
+    )
+    return MultiTimeframeStrongSignalStrategy(
+        base=base, tf_bias=M15, tf_confirm=M5, tf_entry=M1
+    )
+
+
+def _window(closes, *, start=0, timed=True):
+    return [
+        {"time": start + i, "close": c} if timed else {"close": c}
+        for i, c in enumerate(closes)
+    ]
+
+
+def test_unchanged_windows_hit_the_memo():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+    by_tf = {
+        M15: _window([1.0, 2.0]),
+        M5: _window([1.0, 2.0, 3.0]),
+        M1: _window([1.0, 2.0, 3.0, 4.0]),
+    }
+
+    first = strategy.generate_signal(by_tf)
+    calls = len(ind.calls)
+    assert strategy.generate_signal(by_tf) is first
+    assert len(ind.calls) == calls
+
+
+def test_timeless_windows_bypass_the_memo():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+    bias = _window([1.0, 2.0], timed=False)
+    confirm = _window([1.0, 2.0, 3.0], timed=False)
+
+    up = strategy.generate_signal(
+        {M15: bias, M5: confirm, M1: _window([1.0, 2.0, 3.0, 4.0], timed=False)}
+    )
+    down = strategy.generate_signal(
+        {M15: bias, M5: confirm, M1: _window([4.0, 3.0, 2.0, 1.0], timed=False)}
+    )
+
+    assert up["m1_entry"] == "buy"
+    assert down["m1_entry"] == "sell"
+
+
+def test_m1_only_movement_reuses_bias_and_confirm():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+    bias = _window([1.0, 2.0])
+    confirm = _window([1.0, 2.0, 3.0])
+
+    strategy.generate_signal(
+        {M15: bias, M5: confirm, M1: _window([1.0, 2.0, 3.0, 4.0])}
+    )
+    assert sorted(ind.calls) == [2, 3, 4]
+
+    ind.calls.clear()
+    moved = strategy.generate_signal(
+        {M15: bias, M5: confirm, M1: _window([2.0, 3.0, 4.0, 3.5], start=1)}
+    )
+    assert ind.calls == [4]  # only the entry window was evaluated
+    assert moved["m1_entry"] == "sell"
+
+
+def test_timeless_higher_timeframe_is_recomputed():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+    confirm = _window([1.0, 2.0, 3.0])
+    entry = _window([1.0, 2.0, 3.0, 4.0])
+
+    up = strategy.generate_signal(
+        {M15: _window([1.0, 2.0], timed=False), M5: confirm, M1: entry}
+    )
+    down = strategy.generate_signal(
+        {M15: _window([2.0, 1.0], timed=False), M5: confirm, M1: entry}
+    )
+
+    assert up["m15_bias"] == "buy"
+    assert down["m15_bias"] == "sell"
+
+
+def test_pullback_is_none_when_timeframes_disagree():
+    strategy = _strategy(_CountingIndicator())
+    result = strategy.generate_signal(
+        {
+            M15: _window([2.0, 1.0]),
+            M5: _window([1.0, 2.0, 3.0]),
+            M1: _window([1.0, 2.0, 3.0, 4.0]),
+        }
+    )
+    assert result["final_signal"] == "hold"
+    assert result["pullback_completed"] is None
+
+
+def test_pullback_is_evaluated_when_timeframes_agree():
+    strategy = _strategy(_CountingIndicator())
+    # Last close above the 20-bar SMA, but the five bars before the window
+    # stayed above it too: evaluated, not completed
+    result = strategy.generate_signal(
+        {
+            M15: _window([1.0, 2.0]),
+            M5: _window([1.0, 2.0, 3.0]),
+            M1: _window([20.0] * 10 + [10.0] * 19 + [11.0]),
+        }
+    )
+    assert result["m1_entry"] == "buy"
+    assert result["pullback_completed"] is False
+    assert result["final_signal"] == "hold"
+
+    # Dip below the SMA in the five bars before the window, then recover
+    closes = [10.0] * 5 + [9.0] + [10.0] * 4 + [10.0] * 19 + [10.5]
+    result = strategy.generate_signal(
+        {
+            M15: _window([1.0, 2.0], start=100),
+            M5: _window([1.0, 2.0, 3.0], start=100),
+            M1: _window(closes, start=100),
+        }
+    )
+    assert result["pullback_completed"] is True
+    assert result["final_signal"] == "buy"
@@ -0,0 +1,115 @@
+import itertools
+
+import pytest
+
+from app.services.trade_services import (
+    _CALL_BALANCE,
+    _CALL_EMPTY,
+    _CALL_KW_SNAPSHOT,
+    _CALL_POSITIONAL,
+    _CLOSED_KEY_ORDER,
+    SignalOrchestrator,
+    _generator_call_mode,
+)
+
+
+def _orchestrator():
+    return SignalOrchestrator(collector=object(), signal_generator=object())
+
+
+def _reference_is_closed(candle):
+    # Precedence rule the probe cache has to preserve
+    for k in _CLOSED_KEY_ORDER:
+        if k in candle:
+            return bool(candle[k])
+    return True
+
+
+def _all_flag_combinations():
+    for r in range(len(_CLOSED_KEY_ORDER) + 1):
+        for keys in itertools.combinations(_CLOSED_KEY_ORDER, r):
+            for values in itertools.product((True, False), repeat=r):
+                yield {"time": 0, **dict(zip(keys, values))}
+
+
+def test_closed_probe_keeps_flag_precedence_after_learning_a_key():
+    candles = list(_all_flag_combinations())
+    for key in _CLOSED_KEY_ORDER:
+        orch = _orchestrator()
+        # Teach the probe a single-flag feed first, then throw every mix at it
+        orch._is_candle_closed({key: False})
+        assert orch._closed_probe[0] == key
+        for candle in candles:
+            assert orch._is_candle_closed(candle) is _reference_is_closed(candle)
+
+
+def test_candle_without_flags_counts_as_closed():
+    orch = _orchestrator()
+    assert orch._is_candle_closed({"time": 0}) is True
+    assert orch._closed_probe is None
+
+
+class _Generators:
+    def positional(self, snapshot):
+        return ("positional", snapshot)
+
+    def kw_snapshot(self, *, candles_snapshot):
+        return ("kw_snapshot", candles_snapshot)
+
+    def empty(self):
+        return ("empty",)
+
+    def balance(self, *, account_balance):
+        return ("balance", account_balance)
+
+    def optional(self, snapshot=None, *, account_balance=None):
+        return ("optional", snapshot)
+
+    def unbindable(self, *, other):
+        return ("unbindable",)
+
+
+@pytest.mark.parametrize(
+    "name, mode",
+    [
+        ("positional", _CALL_POSITIONAL),
+        ("kw_snapshot", _CALL_KW_SNAPSHOT),
+        ("empty", _CALL_EMPTY),
+        ("balance", _CALL_BALANCE),
+        # Same precedence the old TypeError cascade had: positional wins
+        ("optional", _CALL_POSITIONAL),
+        ("unbindable", None),
+    ],
+)
+def test_generator_call_mode_from_signature(name, mode):
+    assert _generator_call_mode(getattr(_Generators(), name)) == mode
+
+
+def test_uninspectable_generator_has_no_call_mode():
+    assert _generator_call_mode(object()) is None
+
+
+class _Broker:
+    def get_account_balance(self):
+        return 1234.5
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("positional", ("positional", "snap")),
+        ("kw_snapshot", ("kw_snapshot", "snap")),
+        ("empty", ("empty",)),
+        ("balance", ("balance", 1234.5)),
+    ],
+)
+def test_call_generator_uses_the_resolved_mode(name, expected):
+    generators = _Generators()
+
+    class _SignalGenerator:
+        generate_signal = getattr(generators, name)
+
+    orch = SignalOrchestrator(
+        collector=object(), signal_generator=_SignalGenerator(), broker=_Broker()
+    )
+    assert orch._call_generator(orch._gen_fn, "snap") == expected
@@ -0,0 +1,54 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.data.tick_collector import TickCollector
+from app.services.trade_services import SignalOrchestrator
+
+
+class _SlowCollector:
+    symbol = "EURUSD"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_latest_candles(self, symbol=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return None
+
+
+def test_fast_restart_never_runs_two_candle_loops():
+    collector = _SlowCollector()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        orch = SignalOrchestrator(
+            collector=collector, signal_generator=object(), executor=pool
+        )
+        for _ in range(5):
+            orch.start()
+            time.sleep(0.03)
+            orch.stop()
+            assert orch._future is None
+        orch.start()
+        time.sleep(0.1)
+        orch.stop()
+    assert collector.max_in_flight == 1
+
+
+def test_stop_drops_a_tick_task_still_queued_in_the_pool():
+    gate = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(gate.wait)  # keeps the only worker busy
+        tick = TickCollector(symbol="EURUSD", interval=0.01, executor=pool)
+        tick.start_collecting()
+        started = time.monotonic()
+        tick.stop_collecting()
+        assert time.monotonic() - started < 1
+        assert tick._future is None
+        gate.set()
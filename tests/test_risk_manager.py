@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.risk.risk_manager import RiskManager
+
+_INFO = SimpleNamespace(volume_min=0.01, volume_max=50.0, volume_step=0.01)
+
+
+class _Broker:
+    def __init__(self, *, pip=0.0001, contract_size=100_000.0, info=_INFO):
+        self.pip = pip
+        self.contract_size = contract_size
+        self.info = info
+        self.info_calls = 0
+
+    def get_pip_size(self, symbol):
+        return self.pip
+
+    def get_lot_value(self, symbol):
+        return self.contract_size
+
+    def get_symbol_info(self, symbol):
+        self.info_calls += 1
+        return self.info
+
+
+def test_lot_size_from_risk_and_stop_distance():
+    broker = _Broker()
+    # 1% of 10k = 100 risked over 20 pips * 0.0001 * 100k = 200 per lot
+    assert RiskManager(broker).calculate_lot_size(10_000, 20, "EURUSD", 1.0) == 0.5
+    assert broker.info_calls == 1
+
+
+def test_stop_below_minimum_is_widened_to_five_pips():
+    lot = RiskManager(_Broker()).calculate_lot_size(10_000, 1, "EURUSD", 1.0)
+    assert lot == 2.0  # same as a 5 pip stop
+
+
+def test_non_positive_pip_falls_back_to_volume_min():
+    lot = RiskManager(_Broker(pip=0.0)).calculate_lot_size(10_000, 20, "EURUSD", 1.0)
+    assert lot == _INFO.volume_min
+
+
+def test_zero_contract_size_still_raises():
+    with pytest.raises(ZeroDivisionError):
+        RiskManager(_Broker(contract_size=0.0)).calculate_lot_size(
+            10_000, 20, "EURUSD", 1.0
+        )
+
+
+def test_missing_symbol_info_returns_zero():
+    lot = RiskManager(_Broker(info=None)).calculate_lot_size(10_000, 20, "EURUSD", 1.0)
+    assert lot == 0.0
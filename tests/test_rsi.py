@@ -0,0 +1,24 @@
+import numpy as np
+
+from app.signals.indicators.rsi import calculate_rsi
+
+
+def _candles(closes):
+    return [{"close": c} for c in closes]
+
+
+def test_falling_closes_are_oversold_buy():
+    closes = [100.0 - i for i in range(20)]
+    assert calculate_rsi(_candles(closes)) == "buy"
+    assert calculate_rsi(np.array(closes)) == "buy"
+
+
+def test_rising_closes_are_overbought_sell():
+    closes = [100.0 + i for i in range(20)]
+    assert calculate_rsi(_candles(closes)) == "sell"
+    assert calculate_rsi(np.array(closes)) == "sell"
+
+
+def test_flat_or_short_window_holds():
+    assert calculate_rsi(_candles([100.0, 101.0] * 10)) == "hold"
+    assert calculate_rsi(_candles([100.0, 99.0])) == "hold"
@@ -0,0 +1,118 @@
+from app.signals.strategies.strong_signal_strategy import StrongSignalStrategy
+
+
+class _CountingIndicator:
+    """Votes 'buy' on a rising last bar, 'sell' on a falling one."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, candles):
+        self.calls += 1
+        return "buy" if candles[-1]["close"] > candles[-2]["close"] else "sell"
+
+
+def _strategy(indicator):
+    return StrongSignalStrategy({"trend": indicator}, min_candles=2)
+
+
+def test_repeat_call_hits_the_memo():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+    candles = [{"time": 1, "close": 1.0}, {"time": 2, "close": 2.0}]
+
+    first = strategy.generate_signal(candles)
+    second = strategy.generate_signal(candles)
+
+    assert ind.calls == 1
+    assert second == first
+
+
+def test_timeless_window_of_same_length_is_recomputed():
+    ind = _CountingIndicator()
+    strategy = _strategy(ind)
+
+    up = strategy.generate_signal([{"close": 1.0}, {"close": 2.0}])
+    down = strategy.generate_signal([{"close": 2.0}, {"close": 1.0}])
+
+    assert ind.calls == 2
+    assert up["final_signal"] == "buy"
+    assert down["final_signal"] == "sell"
+
+
+def test_mutating_a_result_does_not_leak_into_the_memo():
+    strategy = _strategy(_CountingIndicator())
+    candles = [{"time": 1, "close": 1.0}, {"time": 2, "close": 2.0}]
+
+    first = strategy.generate_signal(candles)
+    first["final_signal"] = "sell"
+    first["indicators"]["trend"] = None
+
+    again = strategy.generate_signal(candles)
+    assert again["final_signal"] == "buy"
+    assert again["indicators"] == {"trend": "buy"}
+
+
+def _fixed(signal):
+    return lambda candles: signal
+
+
+def _timed(n=2):
+    return [{"time": i, "close": 1.0} for i in range(n)]
+
+
+def test_confidence_gate_matches_the_float_threshold():
+    # Four indicators, threshold 0.5: two non-hold votes are the minimum
+    strategy = StrongSignalStrategy(
+        {
+            "a": _fixed("buy"),
+            "b": _fixed("buy"),
+            "c": _fixed("hold"),
+            "d": _fixed("hold"),
+        },
+        min_candles=2,
+        confidence_threshold=0.5,
+    )
+    assert strategy._min_votes == 2
+    result = strategy.generate_signal(_timed())
+    assert result["final_signal"] == "buy"
+    assert result["confidence"] == 0.5
+
+
+def test_below_threshold_holds():
+    strategy = StrongSignalStrategy(
+        {"a": _fixed("sell"), "b": _fixed("hold"), "c": _fixed("hold")},
+        min_candles=2,
+        confidence_threshold=0.5,
+    )
+    assert strategy._min_votes == 2
+    result = strategy.generate_signal(_timed())
+    assert result["final_signal"] == "hold"
+    assert result["confidence"] == 1 / 3
+
+
+def test_opposing_votes_count_towards_confidence_but_cancel_out():
+    strategy = StrongSignalStrategy(
+        {"a": _fixed("buy"), "b": _fixed("sell")},
+        min_candles=2,
+        confidence_threshold=0.5,
+    )
+    result = strategy.generate_signal(_timed())
+    assert result["confidence"] == 1.0
+    assert result["final_signal"] == "hold"
+
+
+def test_unreachable_threshold_always_holds():
+    strategy = StrongSignalStrategy(
+        {"a": _fixed("buy")}, min_candles=2, confidence_threshold=1.5
+    )
+    assert strategy._min_votes == 2
+    assert strategy.generate_signal(_timed())["final_signal"] == "hold"
+
+
+def test_no_indicators_uses_a_divisor_of_one():
+    strategy = StrongSignalStrategy({}, min_candles=2, confidence_threshold=0.0)
+    assert strategy._vote_divisor == 1
+    result = strategy.generate_signal(_timed())
+    assert result["confidence"] == 0.0
+    assert result["final_signal"] == "hold"